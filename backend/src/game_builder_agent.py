@@ -1,27 +1,155 @@
 """Game Builder Agent for SynonymSeeker."""
 
 import os
-import json
-import uuid
+import logging
+import random
 import asyncio
+import threading
 import httpx
 import time
-from typing import Dict, Any, Optional, List
+import orjson
+import importlib.util
+from functools import cached_property
+from secrets import token_hex
+from types import MappingProxyType
+from typing import Dict, Any, Mapping, Optional, List, Tuple
+from rapidfuzz import process
+from rapidfuzz.distance import Levenshtein
 from strands import Agent, tool
-from a2a.client import A2ACardResolver, ClientConfig, ClientFactory
+from a2a.client import A2ACardResolver, ClientCallContext, ClientConfig, ClientFactory
 from a2a.types import Message, Part, Role, TextPart
+from .session_store import SESSION_TTL, InMemorySessionStore, SessionStore, create_session_store
 from .models import (
     GameSession, SynonymSlot, GameStatus,
-    StartGameResponse, GuessRequest, GuessResponse, GiveUpResponse
+    StartGameResponse, GuessRequest, GuessResponse, GiveUpResponse, ValidationError
 )
 
 
+logger = logging.getLogger(__name__)
+
+# Timeout for agent-to-agent communication with the Hint Provider
+A2A_TIMEOUT = 30  # 30 seconds
+
+# How long a resolved Hint Provider agent card is reused before fetching it again
+AGENT_CARD_TTL = 10 * 60  # 10 minutes
+
+# httpx only supports HTTP/2 when the optional h2 package is installed
+_HTTP2_AVAILABLE = importlib.util.find_spec('h2') is not None
+
+# rapidfuzz ships its bit-parallel Levenshtein precompiled, but silently falls back to
+# pure Python if the extension can't load (e.g. a wheel built for the wrong platform)
+if Levenshtein.distance.__module__.endswith('_py'):
+    logger.warning("rapidfuzz compiled extension unavailable, using slow pure-Python edit distance")
+
+# Synchronous HTTP client shared by direct Hint Provider calls so connections are reused
+_http_client: Optional[httpx.Client] = None
+_http_client_lock = threading.Lock()
+
+
+def _get_http_client() -> httpx.Client:
+    """Get the shared synchronous HTTP client, creating it on first use."""
+    global _http_client
+    with _http_client_lock:
+        if _http_client is None:
+            _http_client = httpx.Client(
+                timeout=10.0,
+                http2=_HTTP2_AVAILABLE,
+                limits=httpx.Limits(max_keepalive_connections=16, keepalive_expiry=60)
+            )
+        return _http_client
+
+
+# Punctuation allowed inside a guess (e.g. "well-known", "o'clock"), deleted before the letter check
+_GUESS_PUNCTUATION_TABLE = str.maketrans('', '', "-'")
+
+
+def _new_session_id() -> str:
+    """Generate a game session ID.
+    
+    128 random bits make collisions negligible, so IDs aren't checked against the
+    session store (which would cost a round trip with Redis). Session IDs also act
+    as the only credential for a game, so they stay long enough not to be guessed.
+    """
+    return token_hex(16)
+
+
+# Curated word sets used for puzzle generation
+_WORD_SETS = {
+    "happy": ("joyful", "cheerful", "glad", "pleased"),
+    "fast": ("quick", "rapid", "swift", "speedy"),
+    "big": ("large", "huge", "enormous", "massive"),
+    "smart": ("clever", "bright", "wise", "brilliant"),
+    "cold": ("chilly", "freezing", "icy", "frigid"),
+    "loud": ("noisy", "booming", "thunderous", "deafening"),
+    "small": ("tiny", "little", "miniature", "petite"),
+    "beautiful": ("gorgeous", "stunning", "lovely", "attractive")
+}
+
+# Placeholder synonyms for sessions whose target word has no word set
+_FALLBACK_SYNONYMS = ("word1", "word2", "word3", "word4")
+
+
+def _build_curated_puzzles() -> tuple:
+    """Validate the curated word sets and pre-format them as puzzle data."""
+    puzzles = []
+    for target_word, synonyms in _WORD_SETS.items():
+        # Validate word set has exactly 4 synonyms
+        if len(synonyms) != 4:
+            raise ValueError(f"Word set must have exactly 4 synonyms, got {len(synonyms)}")
+        
+        # Validate all synonyms are appropriate length (not too short/long)
+        for syn in synonyms:
+            if len(syn) < 3 or len(syn) > 15:
+                raise ValueError(f"Synonym '{syn}' has inappropriate length: {len(syn)}")
+        
+        # Synonyms are a tuple since every game shares these puzzle dicts; the
+        # slot lengths are precomputed so games don't re-measure the words
+        puzzles.append({
+            "target_word": target_word,
+            "synonyms": tuple(
+                {"word": syn, "letter_count": len(syn)}
+                for syn in synonyms
+            ),
+            "slot_lengths": tuple(len(syn) for syn in synonyms)
+        })
+    
+    return tuple(puzzles)
+
+
+# Built once at import so game creation doesn't re-validate static data
+_CURATED_PUZZLES = _build_curated_puzzles()
+
+
 class GameBuilderAgent:
     """Main agent responsible for game state management and guess validation."""
     
     def __init__(self):
         """Initialize the Game Builder Agent."""
-        self.agent = Agent(
+        # Session storage, selected by SESSION_BACKEND (in-memory unless configured otherwise)
+        try:
+            self.sessions: SessionStore = create_session_store()
+        except Exception as e:
+            logger.warning("Session store unavailable, falling back to in-memory sessions: %s", e)
+            self.sessions = InMemorySessionStore()
+        
+        # Session cleanup tracking
+        self.session_cleanup_interval = 60  # 1 minute
+        self.session_sweep_batch = 500  # Max sessions evicted per cleanup
+        self.last_cleanup = time.monotonic()
+        
+        # Background event loop and A2A clients reused across hint requests
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_lock = threading.Lock()
+        self._a2a_clients: Dict[str, Tuple[float, Any]] = {}  # url -> (card fetched at, client)
+        self._a2a_http_clients: Dict[str, httpx.AsyncClient] = {}
+    
+    @cached_property
+    def agent(self) -> Agent:
+        """Strands agent exposing the game tools, built only when first used.
+        
+        lambda_handler calls the game methods directly, so API requests never pay for it.
+        """
+        return Agent(
             tools=[
                 self.generate_word_puzzle,
                 self.validate_guess,
@@ -46,50 +174,57 @@ Game Rules:
 
 Always respond with valid JSON for API endpoints and maintain game state consistency."""
         )
-        
-        # In-memory session storage (for development - would use database in production)
-        self.sessions: Dict[str, GameSession] = {}
-        
-        # Session cleanup tracking
-        self.session_cleanup_interval = 30 * 60  # 30 minutes
-        self.last_cleanup = time.time()
     
     def _cleanup_expired_sessions(self) -> None:
         """Clean up expired sessions to prevent memory leaks."""
-        current_time = time.time()
+        now = time.monotonic()
         
-        # Only run cleanup periodically
-        if current_time - self.last_cleanup < self.session_cleanup_interval:
+        # Only run cleanup periodically, and never for stores that expire sessions themselves
+        if self.sessions.expires_natively or now - self.last_cleanup < self.session_cleanup_interval:
             return
         
-        expired_sessions = []
-        session_timeout = 30 * 60  # 30 minutes
+        # Activity timestamps are wall-clock time since sessions can be stored outside this process
+        current_time = time.time()
         
-        for session_id, session in self.sessions.items():
+        def is_expired(session: GameSession) -> bool:
             # Check if session has been inactive for too long
             # For simplicity, we'll use a basic timeout approach
-            if hasattr(session, '_last_activity'):
-                if current_time - session._last_activity > session_timeout:
-                    expired_sessions.append(session_id)
-            else:
-                # Add activity tracking to existing sessions
-                session._last_activity = current_time
+            last_activity = getattr(session, '_last_activity', None)
+            if last_activity is not None:
+                return current_time - last_activity > SESSION_TTL
+            # Add activity tracking to existing sessions
+            session._last_activity = current_time
+            return False
         
-        # Remove expired sessions
-        for session_id in expired_sessions:
-            print(f"Cleaning up expired session: {session_id}")
-            del self.sessions[session_id]
+        # Remove expired sessions in bounded batches
+        expired = self.sessions.sweep(is_expired, limit=self.session_sweep_batch)
+        for session_id in expired:
+            logger.info("Cleaning up expired session: %s", session_id)
         
-        self.last_cleanup = current_time
+        # A full batch means there may be a backlog, so leave the next sweep due
+        if len(expired) < self.session_sweep_batch:
+            self.last_cleanup = now
         
         # Log session count for monitoring
-        if len(self.sessions) > 100:  # Warn if too many sessions
-            print(f"Warning: {len(self.sessions)} active sessions")
+        session_count = len(self.sessions)
+        if session_count > 100:  # Warn if too many sessions
+            logger.warning("%d active sessions", session_count)
+    
+    def _cache_session_synonyms(self, session: GameSession, actual_synonyms: List[str]) -> None:
+        """Store the session's synonyms along with normalized copies used for guess checks."""
+        session._actual_synonyms = list(actual_synonyms)
+        session._synonyms_lower = tuple(syn.lower() for syn in actual_synonyms)
+        # Bit n is set when some synonym has n letters
+        session._synonym_length_bits = sum(1 << length for length in {len(syn) for syn in actual_synonyms})
+        session._target_lower = session.target_word.lower()
+        # Seeded with the target so a single set lookup catches both target and repeated guesses
+        session._guessed_lower = {guess.lower() for guess in session.guessed_words}
+        session._guessed_lower.add(session._target_lower)
     
     def _update_session_activity(self, session: GameSession) -> None:
-        """Update session activity timestamp."""
-        import time
+        """Update session activity timestamp and its recency in the session store."""
         session._last_activity = time.time()
+        self.sessions.touch(session.session_id)
     
     @tool
     def generate_word_puzzle(self) -> dict:
@@ -105,7 +240,7 @@ Always respond with valid JSON for API endpoints and maintain game state consist
                 try:
                     return self._generate_from_external_api()
                 except Exception as e:
-                    print(f"External API failed, falling back to curated words: {e}")
+                    logger.warning("External API failed, falling back to curated words: %s", e)
                     # Continue to fallback
             
             # Fallback to curated word set for reliable gameplay
@@ -113,7 +248,7 @@ Always respond with valid JSON for API endpoints and maintain game state consist
             
         except Exception as e:
             # Ultimate fallback - return a simple, guaranteed word set
-            print(f"Word generation failed, using emergency fallback: {e}")
+            logger.error("Word generation failed, using emergency fallback: %s", e)
             return {
                 "target_word": "happy",
                 "synonyms": [
@@ -128,8 +263,6 @@ Always respond with valid JSON for API endpoints and maintain game state consist
         """Generate word puzzle using external thesaurus API."""
         # This would integrate with a real thesaurus API
         # For now, simulate API behavior with potential failures
-        import random
-        
         # Simulate API failure occasionally for testing
         if random.random() < 0.1:  # 10% failure rate for testing
             raise Exception("Simulated external API failure")
@@ -139,61 +272,7 @@ Always respond with valid JSON for API endpoints and maintain game state consist
     
     def _generate_from_curated_words(self) -> dict:
         """Generate word puzzle from curated word sets."""
-        word_sets = [
-            {
-                "target_word": "happy",
-                "synonyms": ["joyful", "cheerful", "glad", "pleased"]
-            },
-            {
-                "target_word": "fast",
-                "synonyms": ["quick", "rapid", "swift", "speedy"]
-            },
-            {
-                "target_word": "big",
-                "synonyms": ["large", "huge", "enormous", "massive"]
-            },
-            {
-                "target_word": "smart",
-                "synonyms": ["clever", "bright", "wise", "brilliant"]
-            },
-            {
-                "target_word": "cold",
-                "synonyms": ["chilly", "freezing", "icy", "frigid"]
-            },
-            {
-                "target_word": "loud",
-                "synonyms": ["noisy", "booming", "thunderous", "deafening"]
-            },
-            {
-                "target_word": "small",
-                "synonyms": ["tiny", "little", "miniature", "petite"]
-            },
-            {
-                "target_word": "beautiful",
-                "synonyms": ["gorgeous", "stunning", "lovely", "attractive"]
-            }
-        ]
-        
-        # Select a random word set
-        import random
-        word_set = random.choice(word_sets)
-        
-        # Validate word set has exactly 4 synonyms
-        if len(word_set["synonyms"]) != 4:
-            raise ValueError(f"Word set must have exactly 4 synonyms, got {len(word_set['synonyms'])}")
-        
-        # Validate all synonyms are appropriate length (not too short/long)
-        for syn in word_set["synonyms"]:
-            if len(syn) < 3 or len(syn) > 15:
-                raise ValueError(f"Synonym '{syn}' has inappropriate length: {len(syn)}")
-        
-        return {
-            "target_word": word_set["target_word"],
-            "synonyms": [
-                {"word": syn, "letter_count": len(syn)} 
-                for syn in word_set["synonyms"]
-            ]
-        }
+        return random.choice(_CURATED_PUZZLES)
     
     @tool
     def validate_guess(self, guess: str, target_word: str, synonyms: list) -> bool:
@@ -214,38 +293,76 @@ Always respond with valid JSON for API endpoints and maintain game state consist
         if guess_lower == target_lower:
             return False
         
-        # Check exact matches
+        # Normalize synonyms, which may be puzzle dicts or plain words
         synonym_words = [syn["word"].lower() if isinstance(syn, dict) else syn.lower() 
                         for syn in synonyms]
         
-        if guess_lower in synonym_words:
-            return True
-        
-        # Check for close misspellings (simple Levenshtein distance)
-        for syn_word in synonym_words:
-            if self._is_close_match(guess_lower, syn_word):
-                return True
+        return self._validate_guess_with_index(guess_lower, synonym_words) is not None
+    
+    def _validate_guess_with_index(self, guess_lower: str, synonyms_lower: List[str],
+                                   length_bits: Optional[int] = None) -> Optional[int]:
+        """Find the index of the synonym a lowercase guess matches exactly or as a close misspelling.
         
-        return False
+        length_bits is an optional bitmap of synonym lengths (bit n set for an n-letter
+        synonym) used to reject guesses whose length is too far from every synonym.
+        """
+        if length_bits is not None:
+            # Matches need a synonym within 2 letters of the guess's length
+            low = max(0, len(guess_lower) - 2)
+            window = (1 << (len(guess_lower) + 3 - low)) - 1
+            if not (length_bits >> low) & window:
+                return None
+        
+        # A single scoring pass covers both: an exact match has distance 0, so it is
+        # returned ahead of any misspelling match
+        return self._find_close_match(guess_lower, synonyms_lower)
+    
+    def _max_edit_distance(self, word: str) -> int:
+        """Get the number of edits still accepted as a misspelling of word."""
+        # Allow 1 error per 3 characters, capped at 2, so short synonyms like
+        # 'glad' don't accept unrelated words like 'sad'
+        return min(2, max(1, len(word) // 3))
     
     def _is_close_match(self, guess: str, target: str) -> bool:
-        """Check if guess is a close misspelling of target using simple edit distance."""
-        if abs(len(guess) - len(target)) > 2:
+        """Check if guess is a close misspelling of target using Levenshtein distance."""
+        max_distance = self._max_edit_distance(target)
+        if abs(len(guess) - len(target)) > max_distance:
             return False
         
-        # Simple edit distance calculation
-        if len(guess) < len(target):
-            guess, target = target, guess
+        # rapidfuzz strips the common prefix and suffix before running its kernel, so
+        # 'briliant' vs 'brilliant' only compares the differing middle; score_cutoff
+        # lets the C implementation stop as soon as it is exceeded
+        return Levenshtein.distance(guess, target, score_cutoff=max_distance) <= max_distance
+    
+    def _find_close_match(self, guess: str, candidates: List[str]) -> Optional[int]:
+        """Find the index of the closest candidate that guess is a misspelling of."""
+        # Edit distance is at least the length difference, so candidates more
+        # than 2 letters longer or shorter can never match
+        guess_length = len(guess)
+        choices = {
+            index: candidate
+            for index, candidate in enumerate(candidates)
+            if abs(len(candidate) - guess_length) <= 2
+        }
+        if not choices:
+            return None
         
-        differences = 0
-        for i, char in enumerate(target):
-            if i >= len(guess) or guess[i] != char:
-                differences += 1
-                if differences > 2:
-                    return False
+        # Score remaining candidates in one C call; results come back closest first.
+        # rapidfuzz runs Myers' bit-parallel algorithm here and builds the
+        # guess's character bitmasks once, reusing them for every candidate.
+        matches = process.extract(
+            guess,
+            choices,
+            scorer=Levenshtein.distance,
+            score_cutoff=2,
+            limit=None
+        )
         
-        differences += len(guess) - len(target)
-        return differences <= 2
+        for candidate, distance, index in matches:
+            if distance <= self._max_edit_distance(candidate):
+                return index
+        
+        return None
     
     @tool
     def request_hint_analysis(self, guess: str, target_word: str) -> str:
@@ -284,11 +401,11 @@ Always respond with valid JSON for API endpoints and maintain game state consist
             except Exception as e:
                 last_error = e
                 method_name = getattr(method, '__name__', f'method_{i}')
-                print(f"Hint method {method_name} failed: {e}")
+                logger.warning("Hint method %s failed: %s", method_name, e)
                 continue
         
         # Ultimate fallback if all methods fail
-        print(f"All hint methods failed, last error: {last_error}")
+        logger.error("All hint methods failed, last error: %s", last_error)
         return self._generate_emergency_fallback_hint(guess, target_word)
     
     def _try_a2a_communication(self, guess: str, target_word: str) -> str:
@@ -305,26 +422,23 @@ Always respond with valid JSON for API endpoints and maintain game state consist
         if not hint_provider_url or hint_provider_url == 'https://your-hint-provider-function-url.lambda-url.us-east-1.on.aws/':
             raise Exception("Direct HTTP URL not configured")
         
-        # Make direct HTTP request to hint provider
-        import httpx
-        
+        # Make direct HTTP request to hint provider over the shared keep-alive client
         try:
-            with httpx.Client(timeout=10.0) as client:
-                response = client.post(
-                    f"{hint_provider_url}/analyze-hint",
-                    json={
-                        "guess": guess,
-                        "target_word": target_word,
-                        "previous_guesses": []
-                    },
-                    headers={"Content-Type": "application/json"}
-                )
-                
-                if response.status_code == 200:
-                    data = response.json()
-                    return data.get("hintText", "")
-                else:
-                    raise Exception(f"HTTP {response.status_code}: {response.text}")
+            response = _get_http_client().post(
+                f"{hint_provider_url}/analyze-hint",
+                json={
+                    "guess": guess,
+                    "target_word": target_word,
+                    "previous_guesses": []
+                },
+                headers={"Content-Type": "application/json"}
+            )
+            
+            if response.status_code == 200:
+                data = response.json()
+                return data.get("hintText", "")
+            else:
+                raise Exception(f"HTTP {response.status_code}: {response.text}")
                     
         except Exception as e:
             raise Exception(f"Direct HTTP communication failed: {e}")
@@ -338,8 +452,10 @@ Always respond with valid JSON for API endpoints and maintain game state consist
         if not guess_clean or not target_clean:
             return "Please enter a valid word to get a hint."
         
+        target_lower = target_clean.lower()
+        
         # Basic hint logic without external dependencies
-        if guess_clean.lower() == target_clean.lower():
+        if guess_clean.lower() == target_lower:
             return f"You can't use the target word '{target_clean}' as a guess! Try finding words that mean the same thing."
         
         if len(guess_clean) < 3:
@@ -357,33 +473,58 @@ Always respond with valid JSON for API endpoints and maintain game state consist
             "beautiful": "Consider words that describe attractiveness or elegance."
         }
         
-        category_hint = category_hints.get(target_clean.lower(), f"Think of words that have a similar meaning to '{target_clean}'.")
+        category_hint = category_hints.get(target_lower, f"Think of words that have a similar meaning to '{target_clean}'.")
         
         return f"'{guess_clean}' is not a synonym of '{target_clean}'. {category_hint}"
     
+    def _get_event_loop(self) -> asyncio.AbstractEventLoop:
+        """Get the background event loop used for A2A calls, starting it on first use."""
+        with self._loop_lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                threading.Thread(target=loop.run_forever, name="a2a-event-loop", daemon=True).start()
+                self._loop = loop
+            return self._loop
+    
     def _request_hint_via_a2a(self, guess: str, target_word: str, hint_provider_url: str) -> str:
         """Request hint via A2A protocol (synchronous wrapper for async call)."""
+        future = None
         try:
-            # Run the async A2A communication
-            return asyncio.run(self._async_request_hint_via_a2a(guess, target_word, hint_provider_url))
+            # Run on the persistent loop so the HTTP connection and A2A client are reused
+            future = asyncio.run_coroutine_threadsafe(
+                self._async_request_hint_via_a2a(guess, target_word, hint_provider_url),
+                self._get_event_loop()
+            )
+            return future.result(timeout=A2A_TIMEOUT)
         except Exception as e:
+            if future is not None:
+                future.cancel()
             raise Exception(f"A2A communication error: {e}")
     
-    async def _async_request_hint_via_a2a(self, guess: str, target_word: str, hint_provider_url: str) -> str:
-        """Request hint via A2A protocol (async implementation)."""
-        DEFAULT_TIMEOUT = 30  # 30 second timeout for agent communication
-        
-        # Generate a unique session ID for this communication
-        session_id = str(uuid.uuid4())
-        
-        # Prepare authentication headers if available
-        headers = {}
-        bearer_token = os.environ.get('BEARER_TOKEN')
-        if bearer_token:
-            headers['Authorization'] = f'Bearer {bearer_token}'
-        headers['X-Amzn-Bedrock-AgentCore-Runtime-Session-Id'] = session_id
+    async def _get_a2a_client(self, hint_provider_url: str) -> Any:
+        """Get the A2A client for the Hint Provider, re-resolving its agent card once the cached one expires."""
+        cached = self._a2a_clients.get(hint_provider_url)
+        if cached is not None and time.monotonic() - cached[0] < AGENT_CARD_TTL:
+            return cached[1]
+        
+        # Keep the HTTP connection pool across agent card refreshes
+        httpx_client = self._a2a_http_clients.get(hint_provider_url)
+        if httpx_client is None:
+            # Prepare authentication headers if available
+            headers = {}
+            bearer_token = os.environ.get('BEARER_TOKEN')
+            if bearer_token:
+                headers['Authorization'] = f'Bearer {bearer_token}'
+            
+            httpx_client = httpx.AsyncClient(
+                timeout=A2A_TIMEOUT,
+                headers=headers,
+                http2=_HTTP2_AVAILABLE,
+                limits=httpx.Limits(max_keepalive_connections=4)
+            )
+            self._a2a_http_clients[hint_provider_url] = httpx_client
         
-        async with httpx.AsyncClient(timeout=DEFAULT_TIMEOUT, headers=headers) as httpx_client:
+        try:
             # Get agent card from the Hint Provider
             resolver = A2ACardResolver(httpx_client=httpx_client, base_url=hint_provider_url)
             agent_card = await resolver.get_agent_card()
@@ -393,15 +534,35 @@ Always respond with valid JSON for API endpoints and maintain game state consist
                 httpx_client=httpx_client,
                 streaming=False,  # Use non-streaming mode for sync response
             )
-            factory = ClientFactory(config)
-            client = factory.create(agent_card)
-            
+            client = ClientFactory(config).create(agent_card)
+        except Exception:
+            self._a2a_clients.pop(hint_provider_url, None)
+            self._a2a_http_clients.pop(hint_provider_url, None)
+            await httpx_client.aclose()
+            raise
+        
+        self._a2a_clients[hint_provider_url] = (time.monotonic(), client)
+        return client
+    
+    async def _async_request_hint_via_a2a(self, guess: str, target_word: str, hint_provider_url: str) -> str:
+        """Request hint via A2A protocol (async implementation)."""
+        # Generate a unique session ID for this communication (AgentCore requires at least 33 characters)
+        session_id = token_hex(17)
+        context = ClientCallContext(state={
+            'http_kwargs': {
+                'headers': {'X-Amzn-Bedrock-AgentCore-Runtime-Session-Id': session_id}
+            }
+        })
+        
+        client = await self._get_a2a_client(hint_provider_url)
+        
+        try:
             # Create message for hint analysis
             message_text = f"Analyze guess '{guess}' for target word '{target_word}'. Provide helpful hint."
             msg = self._create_a2a_message(text=message_text)
             
             # Send message and get response
-            async for event in client.send_message(msg):
+            async for event in client.send_message(msg, context=context):
                 if isinstance(event, Message):
                     # Extract text from message parts
                     return self._extract_text_from_message(event)
@@ -418,6 +579,13 @@ Always respond with valid JSON for API endpoints and maintain game state consist
                 else:
                     # Fallback for other response types
                     return str(event)
+        except Exception:
+            # Drop the cached client and connections so the next request reconnects
+            self._a2a_clients.pop(hint_provider_url, None)
+            stale_http_client = self._a2a_http_clients.pop(hint_provider_url, None)
+            if stale_http_client is not None:
+                await stale_http_client.aclose()
+            raise
         
         raise Exception("No response received from Hint Provider agent")
     
@@ -427,7 +595,7 @@ Always respond with valid JSON for API endpoints and maintain game state consist
             kind="message",
             role=role,
             parts=[TextPart(kind="text", text=text)],
-            message_id=uuid.uuid4().hex,
+            message_id=token_hex(16),
         )
     
     def _extract_text_from_message(self, message: Message) -> str:
@@ -451,86 +619,63 @@ Always respond with valid JSON for API endpoints and maintain game state consist
     
     def start_new_game(self) -> StartGameResponse:
         """Start a new game session with comprehensive error handling."""
-        max_retries = 3
-        last_error = None
-        
-        for attempt in range(max_retries):
-            try:
-                # Generate word puzzle with fallback handling
-                puzzle_data = self.generate_word_puzzle()
-                
-                # Validate puzzle data
-                if not self._validate_puzzle_data(puzzle_data):
-                    raise ValueError("Generated puzzle data is invalid")
-                
-                # Create session with unique ID
-                session_id = str(uuid.uuid4())
-                
-                # Ensure session ID is unique (handle collision)
-                collision_count = 0
-                while session_id in self.sessions and collision_count < 10:
-                    session_id = str(uuid.uuid4())
-                    collision_count += 1
-                
-                if collision_count >= 10:
-                    raise Exception("Unable to generate unique session ID")
-                
-                synonyms = [
-                    SynonymSlot(
-                        word=None,
-                        letter_count=syn["letter_count"],
-                        found=False
-                    )
-                    for syn in puzzle_data["synonyms"]
-                ]
-                
-                session = GameSession(
-                    session_id=session_id,
-                    target_word=puzzle_data["target_word"],
-                    synonyms=synonyms,
-                    guess_count=0,
-                    status=GameStatus.ACTIVE,
-                    guessed_words=[]
-                )
-                
-                # Store the actual synonym words for validation (not exposed to client)
-                session._actual_synonyms = [syn["word"] for syn in puzzle_data["synonyms"]]
-                
-                # Add activity tracking
-                self._update_session_activity(session)
-                
-                # Store session with error handling
-                try:
-                    self.sessions[session_id] = session
-                except Exception as e:
-                    raise Exception(f"Failed to store session: {e}")
-                
-                # Return response
-                return StartGameResponse(
-                    session_id=session_id,
-                    target_word=puzzle_data["target_word"],
-                    synonym_slots=[
-                        {"letterCount": slot.letter_count} 
-                        for slot in synonyms
-                    ]
+        # generate_word_puzzle already falls back to curated and emergency puzzles,
+        # so a single pass is enough; anything that still fails gets an emergency game
+        try:
+            # Generate word puzzle with fallback handling
+            puzzle_data = self.generate_word_puzzle()
+            
+            # Validate puzzle data
+            if not self._validate_puzzle_data(puzzle_data):
+                raise ValueError("Generated puzzle data is invalid")
+            
+            # Create session with unique ID
+            session_id = _new_session_id()
+            
+            synonyms = [
+                SynonymSlot(
+                    word=None,
+                    letter_count=syn["letter_count"],
+                    found=False
                 )
-                
+                for syn in puzzle_data["synonyms"]
+            ]
+            
+            session = GameSession(
+                session_id=session_id,
+                target_word=puzzle_data["target_word"],
+                synonyms=synonyms,
+                guess_count=0,
+                status=GameStatus.ACTIVE,
+                guessed_words=[]
+            )
+            
+            # Store the actual synonym words for validation (not exposed to client)
+            self._cache_session_synonyms(session, [syn["word"] for syn in puzzle_data["synonyms"]])
+            
+            # Add activity tracking
+            self._update_session_activity(session)
+            
+            # Store session with error handling
+            try:
+                self.sessions.put(session_id, session)
             except Exception as e:
-                last_error = e
-                print(f"Game creation attempt {attempt + 1} failed: {e}")
-                
-                if attempt < max_retries - 1:
-                    # Wait before retrying
-                    import time
-                    time.sleep(0.5 * (attempt + 1))  # Exponential backoff
-                    continue
-                else:
-                    # Final attempt failed
-                    break
-        
-        # If all attempts failed, create emergency fallback game
-        print(f"All game creation attempts failed, creating emergency game. Last error: {last_error}")
-        return self._create_emergency_game()
+                raise Exception(f"Failed to store session: {e}")
+            
+            # Return response
+            # Curated puzzles carry precomputed slot lengths; the slot dicts are
+            # built fresh so no two responses share them
+            slot_lengths = puzzle_data.get("slot_lengths") or [slot.letter_count for slot in synonyms]
+            synonym_slots = [{"letterCount": length} for length in slot_lengths]
+            return StartGameResponse(
+                session_id=session_id,
+                target_word=puzzle_data["target_word"],
+                synonym_slots=synonym_slots
+            )
+            
+        except Exception as e:
+            logger.error("Game creation failed, creating emergency game: %s", e)
+            return self._create_emergency_game()
     
     def _validate_puzzle_data(self, puzzle_data: dict) -> bool:
         """Validate generated puzzle data structure."""
@@ -541,7 +686,7 @@ Always respond with valid JSON for API endpoints and maintain game state consist
             if "target_word" not in puzzle_data or not puzzle_data["target_word"]:
                 return False
             
-            if "synonyms" not in puzzle_data or not isinstance(puzzle_data["synonyms"], list):
+            if "synonyms" not in puzzle_data or not isinstance(puzzle_data["synonyms"], (list, tuple)):
                 return False
             
             if len(puzzle_data["synonyms"]) != 4:
@@ -566,7 +711,7 @@ Always respond with valid JSON for API endpoints and maintain game state consist
     
     def _create_emergency_game(self) -> StartGameResponse:
         """Create emergency fallback game when all else fails."""
-        session_id = f"emergency-{uuid.uuid4().hex[:8]}"
+        session_id = f"emergency-{_new_session_id()}"
         
         # Simple, guaranteed-to-work game
         emergency_synonyms = [
@@ -585,8 +730,11 @@ Always respond with valid JSON for API endpoints and maintain game state consist
             guessed_words=[]
         )
         
-        session._actual_synonyms = ["glad", "joyful", "pleased", "cheerful"]
-        self.sessions[session_id] = session
+        self._cache_session_synonyms(session, ["glad", "joyful", "pleased", "cheerful"])
+        
+        # Tracked like any other game so the cleanup sweep can expire it
+        self._update_session_activity(session)
+        self._save_session(session_id, session)
         
         return StartGameResponse(
             session_id=session_id,
@@ -601,6 +749,7 @@ Always respond with valid JSON for API endpoints and maintain game state consist
     
     def submit_guess(self, request: GuessRequest) -> GuessResponse:
         """Process a player's guess with comprehensive error handling."""
+        session = None
         try:
             # Session validation with recovery
             session = self._get_session_with_recovery(request.session_id)
@@ -624,7 +773,7 @@ Always respond with valid JSON for API endpoints and maintain game state consist
             # Input validation and sanitization
             try:
                 sanitized_guess = self._sanitize_and_validate_guess(request.guess)
-            except ValueError as e:
+            except ValidationError as e:
                 session.guess_count += 1  # Count invalid attempts
                 return GuessResponse(
                     success=False,
@@ -633,20 +782,19 @@ Always respond with valid JSON for API endpoints and maintain game state consist
                     game_state=self._get_game_state_dict(session)
                 )
 
-            # Check if guess is the target word itself
-            if sanitized_guess.lower() == session.target_word.lower():
-                session.guess_count += 1
-                session.guessed_words.append(sanitized_guess)
-                return GuessResponse(
-                    success=False,
-                    message=f"You can't use the target word '{session.target_word}' as a guess! Try finding words that mean the same thing.",
-                    hint=None,
-                    game_state=self._get_game_state_dict(session)
-                )
-
-            # Check for duplicate guess
-            if sanitized_guess.lower() in [g.lower() for g in session.guessed_words]:
+            guess_lower = sanitized_guess.lower()
+            
+            # Check for the target word itself or a duplicate guess
+            if guess_lower in session._guessed_lower:
                 session.guess_count += 1
+                if guess_lower == session._target_lower:
+                    session.guessed_words.append(sanitized_guess)
+                    return GuessResponse(
+                        success=False,
+                        message=f"You can't use the target word '{session.target_word}' as a guess! Try finding words that mean the same thing.",
+                        hint=None,
+                        game_state=self._get_game_state_dict(session)
+                    )
                 return GuessResponse(
                     success=False,
                     message=f"You already guessed '{sanitized_guess}'. Try a different word.",
@@ -656,37 +804,25 @@ Always respond with valid JSON for API endpoints and maintain game state consist
 
             # Add guess to history
             session.add_guess(sanitized_guess)
+            session._guessed_lower.add(guess_lower)
 
-            # Validate guess using actual synonyms with error handling
+            # Validate guess using the session's cached lowercase synonyms
             try:
-                actual_synonyms = getattr(session, '_actual_synonyms', [])
-                if not actual_synonyms:
-                    # Recovery: regenerate synonyms if missing
-                    actual_synonyms = self._recover_session_synonyms(session)
-                
-                synonym_data = [
-                    {"word": syn_word, "letter_count": len(syn_word)}
-                    for syn_word in actual_synonyms
-                ]
-
-                is_valid = self.validate_guess(sanitized_guess, session.target_word, synonym_data)
+                match_index = self._validate_guess_with_index(
+                    guess_lower, session._synonyms_lower, session._synonym_length_bits
+                )
             except Exception as e:
-                print(f"Guess validation failed: {e}")
+                logger.warning("Guess validation failed: %s", e)
                 # Fallback validation
-                is_valid = self._fallback_guess_validation(sanitized_guess, session)
+                match_index = self._fallback_guess_validation(guess_lower, session)
 
-            if is_valid:
-                # Find matching synonym slot and mark as found
+            if match_index is not None:
+                # Mark the matched synonym slot as found
                 try:
-                    actual_synonyms = getattr(session, '_actual_synonyms', [])
-                    for i, slot in enumerate(session.synonyms):
-                        if (slot.word is None and 
-                            i < len(actual_synonyms) and
-                            (sanitized_guess.lower() == actual_synonyms[i].lower() or
-                             self._is_close_match(sanitized_guess.lower(), actual_synonyms[i].lower()))):
-                            slot.word = sanitized_guess
-                            slot.found = True
-                            break
+                    slot = session.synonyms[match_index]
+                    if slot.word is None:
+                        slot.word = sanitized_guess
+                        slot.found = True
 
                     # Check if game is complete
                     if session.is_complete():
@@ -702,7 +838,7 @@ Always respond with valid JSON for API endpoints and maintain game state consist
                         game_state=self._get_game_state_dict(session)
                     )
                 except Exception as e:
-                    print(f"Error updating game state for correct guess: {e}")
+                    logger.error("Error updating game state for correct guess: %s", e)
                     # Return success but with basic message
                     return GuessResponse(
                         success=True,
@@ -715,7 +851,7 @@ Always respond with valid JSON for API endpoints and maintain game state consist
                 try:
                     hint = self.request_hint_analysis(sanitized_guess, session.target_word)
                 except Exception as e:
-                    print(f"Hint generation failed: {e}")
+                    logger.warning("Hint generation failed: %s", e)
                     hint = f"'{sanitized_guess}' is not a synonym of '{session.target_word}'. Try thinking of words with similar meanings."
 
                 return GuessResponse(
@@ -726,7 +862,7 @@ Always respond with valid JSON for API endpoints and maintain game state consist
                 )
                 
         except Exception as e:
-            print(f"Unexpected error in submit_guess: {e}")
+            logger.exception("Unexpected error in submit_guess: %s", e)
             # Return generic error response
             return GuessResponse(
                 success=False,
@@ -734,6 +870,16 @@ Always respond with valid JSON for API endpoints and maintain game state consist
                 hint=None,
                 game_state={}
             )
+        finally:
+            if session is not None:
+                self._save_session(request.session_id, session)
+    
+    def _save_session(self, session_id: str, session: GameSession) -> None:
+        """Write a mutated session back to the session store."""
+        try:
+            self.sessions.put(session_id, session)
+        except Exception as e:
+            logger.error("Failed to save session %s: %s", session_id, e)
     
     def _get_session_with_recovery(self, session_id: str) -> Optional[GameSession]:
         """Get session with recovery for corrupted or missing sessions."""
@@ -752,116 +898,94 @@ Always respond with valid JSON for API endpoints and maintain game state consist
         
         # Validate session integrity
         try:
-            # Check required attributes
-            if not hasattr(session, 'target_word') or not session.target_word:
+            # Required fields are declared on the slotted GameSession, so read them directly
+            if not session.target_word:
                 raise ValueError("Session missing target word")
             
-            if not hasattr(session, 'synonyms') or not session.synonyms:
+            synonyms = session.synonyms
+            if not synonyms:
                 raise ValueError("Session missing synonyms")
             
-            if len(session.synonyms) != 4:
+            if len(synonyms) != 4:
                 raise ValueError("Session has incorrect number of synonyms")
             
-            if not hasattr(session, 'status'):
-                session.status = GameStatus.ACTIVE
-            
-            if not hasattr(session, 'guess_count'):
-                session.guess_count = 0
-            
-            if not hasattr(session, 'guessed_words'):
-                session.guessed_words = []
-            
-            # Recover missing actual synonyms if needed
-            if not hasattr(session, '_actual_synonyms') or not session._actual_synonyms:
-                session._actual_synonyms = self._recover_session_synonyms(session)
+            # Recover missing actual synonyms and their normalized lookups if needed
+            actual_synonyms = getattr(session, '_actual_synonyms', None)
+            if not actual_synonyms:
+                self._cache_session_synonyms(session, self._recover_session_synonyms(session))
+            elif getattr(session, '_synonyms_lower', None) is None:
+                self._cache_session_synonyms(session, actual_synonyms)
             
             return session
             
         except Exception as e:
-            print(f"Session recovery failed for {session_id}: {e}")
+            logger.warning("Session recovery failed for %s: %s", session_id, e)
             # Remove corrupted session
-            if session_id in self.sessions:
-                del self.sessions[session_id]
+            self.sessions.delete(session_id)
             return None
     
     def _recover_session_synonyms(self, session: GameSession) -> List[str]:
         """Recover synonyms for a session based on target word."""
         # Use the same curated word sets to recover synonyms
-        word_sets = {
-            "happy": ["joyful", "cheerful", "glad", "pleased"],
-            "fast": ["quick", "rapid", "swift", "speedy"],
-            "big": ["large", "huge", "enormous", "massive"],
-            "smart": ["clever", "bright", "wise", "brilliant"],
-            "cold": ["chilly", "freezing", "icy", "frigid"],
-            "loud": ["noisy", "booming", "thunderous", "deafening"],
-            "small": ["tiny", "little", "miniature", "petite"],
-            "beautiful": ["gorgeous", "stunning", "lovely", "attractive"]
-        }
-        
-        synonyms = word_sets.get(session.target_word.lower(), [])
-        if len(synonyms) >= 4:
-            return synonyms[:4]
-        
-        # Fallback: generate generic synonyms
-        return ["word1", "word2", "word3", "word4"]
+        synonyms = _WORD_SETS.get(session.target_word.lower(), _FALLBACK_SYNONYMS)
+        return list(synonyms[:4])
     
     def _sanitize_and_validate_guess(self, guess: str) -> str:
         """Sanitize and validate guess input."""
         if not guess or not isinstance(guess, str):
-            raise ValueError("Guess is required")
+            raise ValidationError("Guess is required")
         
         # Basic sanitization
         sanitized = guess.strip()
         
         if not sanitized:
-            raise ValueError("Guess cannot be empty")
+            raise ValidationError("Guess cannot be empty")
         
         # Length validation
         if len(sanitized) > 50:
-            raise ValueError("Guess is too long (maximum 50 characters)")
+            raise ValidationError("Guess is too long (maximum 50 characters)")
         
-        # Multiple words check
-        if ' ' in sanitized:
-            raise ValueError("Please enter only one word")
-        
-        # Character validation
-        if not sanitized.replace('-', '').replace("'", "").isalpha():
-            raise ValueError("Please use only letters")
+        # Character validation; a space also fails it, so check for one only to pick the message
+        if not sanitized.translate(_GUESS_PUNCTUATION_TABLE).isalpha():
+            if ' ' in sanitized:
+                raise ValidationError("Please enter only one word")
+            raise ValidationError("Please use only letters")
         
         return sanitized
     
-    def _fallback_guess_validation(self, guess: str, session: GameSession) -> bool:
-        """Fallback validation when main validation fails."""
+    def _fallback_guess_validation(self, guess_lower: str, session: GameSession) -> Optional[int]:
+        """Fallback validation when main validation fails, returning the matched synonym index."""
         try:
             # Simple validation based on target word
-            target_lower = session.target_word.lower()
-            guess_lower = guess.lower()
+            target_lower = session._target_lower or session.target_word.lower()
             
             # Don't accept the target word itself
             if guess_lower == target_lower:
-                return False
+                return None
             
-            # Use recovered synonyms for basic validation
-            actual_synonyms = getattr(session, '_actual_synonyms', [])
-            if not actual_synonyms:
-                actual_synonyms = self._recover_session_synonyms(session)
+            # Use the session's lowercased synonyms, recovering them if missing
+            synonyms_lower = session._synonyms_lower
+            if not synonyms_lower:
+                synonyms_lower = tuple(syn.lower() for syn in self._recover_session_synonyms(session))
             
             # Check exact matches
-            for syn in actual_synonyms:
-                if guess_lower == syn.lower():
-                    return True
-                # Check close matches
-                if self._is_close_match(guess_lower, syn.lower()):
-                    return True
+            if guess_lower in synonyms_lower:
+                return synonyms_lower.index(guess_lower)
             
-            return False
+            # Check close matches
+            for i, syn_lower in enumerate(synonyms_lower):
+                if self._is_close_match(guess_lower, syn_lower):
+                    return i
+            
+            return None
             
         except Exception:
             # Ultimate fallback: reject unknown guesses
-            return False
+            return None
     
     def give_up(self, session_id: str) -> GiveUpResponse:
         """Handle give up request with comprehensive error handling."""
+        session = None
         try:
             # Session validation with recovery
             session = self._get_session_with_recovery(session_id)
@@ -890,7 +1014,7 @@ Always respond with valid JSON for API endpoints and maintain game state consist
                 )
                 
             except Exception as e:
-                print(f"Error revealing synonyms: {e}")
+                logger.error("Error revealing synonyms: %s", e)
                 # Fallback: mark game as given up even if we can't reveal all synonyms
                 session.status = GameStatus.GIVEN_UP
                 
@@ -900,11 +1024,14 @@ Always respond with valid JSON for API endpoints and maintain game state consist
                 )
                 
         except Exception as e:
-            print(f"Unexpected error in give_up: {e}")
+            logger.exception("Unexpected error in give_up: %s", e)
             return GiveUpResponse(
                 message="An error occurred ending the game. Please start a new game.",
                 game_state={}
             )
+        finally:
+            if session is not None:
+                self._save_session(session_id, session)
     
     def _get_game_state_dict(self, session: GameSession) -> dict:
         """Convert GameSession to dictionary for API response."""
@@ -924,22 +1051,153 @@ Always respond with valid JSON for API endpoints and maintain game state consist
         }
 
 
+# Maximum accepted request body size in UTF-8 bytes
+MAX_REQUEST_SIZE = 1024 * 1024  # 1MB
+
+
+def _exceeds_request_size(body: str) -> bool:
+    """Check whether body is over MAX_REQUEST_SIZE bytes, encoding only when the length is ambiguous."""
+    # UTF-8 uses 1-4 bytes per character, so the character count bounds the byte size
+    if len(body) > MAX_REQUEST_SIZE:
+        return True
+    if len(body) * 4 <= MAX_REQUEST_SIZE:
+        return False
+    return len(body.encode('utf-8')) > MAX_REQUEST_SIZE
+
+
+def _json_dumps(payload: Any) -> str:
+    """Serialize a response body with orjson (Lambda expects a str body)."""
+    return orjson.dumps(payload).decode()
+
+
+# CORS headers shared by every response; JSON responses add a Content-Type.
+# Read-only, since each response gets its own copy
+_CORS_HEADERS = MappingProxyType({
+    'Access-Control-Allow-Origin': '*',
+    'Access-Control-Allow-Methods': 'POST, OPTIONS',
+    'Access-Control-Allow-Headers': 'Content-Type'
+})
+_JSON_HEADERS = MappingProxyType({'Content-Type': 'application/json', **_CORS_HEADERS})
+
+
+def _response(status_code: int, headers: Mapping[str, str], body: str) -> dict:
+    """Build a Lambda proxy response with its own copy of the headers."""
+    return {
+        'statusCode': status_code,
+        'headers': dict(headers),
+        'body': body
+    }
+
+
+def _json_response(status_code: int, payload: Any) -> dict:
+    """Build a Lambda proxy response with a JSON body."""
+    return _response(status_code, _JSON_HEADERS, _json_dumps(payload))
+
+
+# Bodies for requests rejected before reaching a handler (cheap to probe, so
+# serialized once); the response dicts themselves are built per request
+_TOO_LARGE_BODY = _json_dumps({'error': 'Request too large'})
+_NOT_FOUND_BODY = _json_dumps({'error': 'Endpoint not found'})
+_INVALID_JSON_BODY = _json_dumps({'error': 'Invalid JSON in request body'})
+
+
+# Agent shared across warm Lambda invocations so sessions and A2A clients persist
+_game_builder: Optional[GameBuilderAgent] = None
+
+
+def _get_game_builder() -> GameBuilderAgent:
+    """Get the shared Game Builder Agent, creating it on first use."""
+    global _game_builder
+    if _game_builder is None:
+        _game_builder = GameBuilderAgent()
+    return _game_builder
+
+
+def _handle_start_game(game_builder: GameBuilderAgent, body: Any) -> dict:
+    """Handle POST /start-game."""
+    try:
+        response = game_builder.start_new_game()
+        return _json_response(200, {
+            'sessionId': response.session_id,
+            'targetWord': response.target_word,
+            'synonymSlots': response.synonym_slots,
+            'status': response.status
+        })
+    except Exception as e:
+        logger.exception("Start game error: %s", e)
+        return _json_response(500, {'error': 'Failed to start new game'})
+
+
+def _handle_submit_guess(game_builder: GameBuilderAgent, body: Any) -> dict:
+    """Handle POST /submit-guess."""
+    try:
+        # Validate required fields
+        if not isinstance(body, dict):
+            raise ValidationError("Request body must be a JSON object")
+        
+        session_id = body.get('sessionId')
+        guess = body.get('guess')
+        
+        if not session_id:
+            raise ValidationError("Session ID is required")
+        
+        if not guess:
+            raise ValidationError("Guess is required")
+        
+        request = GuessRequest(session_id=session_id, guess=guess)
+        response = game_builder.submit_guess(request)
+        
+        return _json_response(200, {
+            'success': response.success,
+            'message': response.message,
+            'hint': response.hint,
+            'gameState': response.game_state
+        })
+    except ValidationError as e:
+        # Handle validation errors from GuessRequest or input validation
+        return _json_response(400, {'error': str(e)})
+    except Exception as e:
+        logger.exception("Submit guess error: %s", e)
+        return _json_response(500, {'error': 'Failed to process guess'})
+
+
+def _handle_give_up(game_builder: GameBuilderAgent, body: Any) -> dict:
+    """Handle POST /give-up."""
+    try:
+        session_id = body.get('sessionId')
+        if not session_id:
+            return _json_response(400, {'error': 'Session ID is required'})
+        
+        response = game_builder.give_up(session_id)
+        return _json_response(200, {
+            'message': response.message,
+            'gameState': response.game_state
+        })
+    except Exception as e:
+        logger.exception("Give up error: %s", e)
+        return _json_response(500, {'error': 'Failed to end game'})
+
+
+# API routes keyed by (HTTP method, path)
+_ROUTES = {
+    ('POST', '/start-game'): _handle_start_game,
+    ('POST', '/submit-guess'): _handle_submit_guess,
+    ('POST', '/give-up'): _handle_give_up,
+}
+
+# Routes whose handlers don't read the request body, so it isn't parsed
+_BODYLESS_ROUTES = frozenset({('POST', '/start-game')})
+
+
 def lambda_handler(event: dict, context: Any) -> dict:
     """AWS Lambda handler for Game Builder Agent with comprehensive error handling."""
     try:
         # Initialize agent with error handling
         try:
-            game_builder = GameBuilderAgent()
+            game_builder = _get_game_builder()
         except Exception as e:
-            print(f"Failed to initialize Game Builder Agent: {e}")
-            return {
-                'statusCode': 500,
-                'headers': {
-                    'Content-Type': 'application/json',
-                    'Access-Control-Allow-Origin': '*'
-                },
-                'body': json.dumps({'error': 'Service temporarily unavailable'})
-            }
+            logger.exception("Failed to initialize Game Builder Agent: %s", e)
+            return _json_response(500, {'error': 'Service temporarily unavailable'})
         
         # Parse request with enhanced validation
         try:
@@ -952,206 +1210,37 @@ def lambda_handler(event: dict, context: Any) -> dict:
             body = event.get('body', '{}')
             
             # Request size validation (Lambda has 6MB limit, we'll use 1MB for safety)
-            MAX_REQUEST_SIZE = 1024 * 1024  # 1MB
-            if isinstance(body, str) and len(body.encode('utf-8')) > MAX_REQUEST_SIZE:
-                return {
-                    'statusCode': 413,
-                    'headers': {
-                        'Content-Type': 'application/json',
-                        'Access-Control-Allow-Origin': '*'
-                    },
-                    'body': json.dumps({'error': 'Request too large'})
-                }
+            if isinstance(body, str) and _exceeds_request_size(body):
+                return _response(413, _JSON_HEADERS, _TOO_LARGE_BODY)
+            
+            handler = _ROUTES.get((http_method, path))
+            if handler is None:
+                if http_method == 'OPTIONS':
+                    # Handle CORS preflight
+                    return _response(200, _CORS_HEADERS, '')
+                return _response(404, _JSON_HEADERS, _NOT_FOUND_BODY)
             
-            # Parse JSON body with error handling
-            if isinstance(body, str):
+            # Parse JSON body with error handling, skipping routes that ignore it
+            if (http_method, path) in _BODYLESS_ROUTES:
+                body = {}
+            elif isinstance(body, str):
                 try:
-                    body = json.loads(body) if body else {}
-                except json.JSONDecodeError as e:
-                    return {
-                        'statusCode': 400,
-                        'headers': {
-                            'Content-Type': 'application/json',
-                            'Access-Control-Allow-Origin': '*'
-                        },
-                        'body': json.dumps({'error': 'Invalid JSON in request body'})
-                    }
+                    body = orjson.loads(body) if body else {}
+                except orjson.JSONDecodeError as e:
+                    return _response(400, _JSON_HEADERS, _INVALID_JSON_BODY)
             
         except Exception as e:
-            print(f"Request parsing error: {e}")
-            return {
-                'statusCode': 400,
-                'headers': {
-                    'Content-Type': 'application/json',
-                    'Access-Control-Allow-Origin': '*'
-                },
-                'body': json.dumps({'error': 'Invalid request format'})
-            }
+            logger.warning("Request parsing error: %s", e)
+            return _json_response(400, {'error': 'Invalid request format'})
         
-        # Route requests with individual error handling
+        # Each handler does its own error handling
         try:
-            if http_method == 'POST' and path == '/start-game':
-                try:
-                    response = game_builder.start_new_game()
-                    return {
-                        'statusCode': 200,
-                        'headers': {
-                            'Content-Type': 'application/json',
-                            'Access-Control-Allow-Origin': '*',
-                            'Access-Control-Allow-Methods': 'POST, OPTIONS',
-                            'Access-Control-Allow-Headers': 'Content-Type'
-                        },
-                        'body': json.dumps({
-                            'sessionId': response.session_id,
-                            'targetWord': response.target_word,
-                            'synonymSlots': response.synonym_slots,
-                            'status': response.status
-                        })
-                    }
-                except Exception as e:
-                    print(f"Start game error: {e}")
-                    return {
-                        'statusCode': 500,
-                        'headers': {
-                            'Content-Type': 'application/json',
-                            'Access-Control-Allow-Origin': '*'
-                        },
-                        'body': json.dumps({'error': 'Failed to start new game'})
-                    }
-            
-            elif http_method == 'POST' and path == '/submit-guess':
-                try:
-                    # Validate required fields
-                    if not isinstance(body, dict):
-                        raise ValueError("Request body must be a JSON object")
-                    
-                    session_id = body.get('sessionId')
-                    guess = body.get('guess')
-                    
-                    if not session_id:
-                        raise ValueError("Session ID is required")
-                    
-                    if not guess:
-                        raise ValueError("Guess is required")
-                    
-                    request = GuessRequest(session_id=session_id, guess=guess)
-                    response = game_builder.submit_guess(request)
-                    
-                    return {
-                        'statusCode': 200,
-                        'headers': {
-                            'Content-Type': 'application/json',
-                            'Access-Control-Allow-Origin': '*',
-                            'Access-Control-Allow-Methods': 'POST, OPTIONS',
-                            'Access-Control-Allow-Headers': 'Content-Type'
-                        },
-                        'body': json.dumps({
-                            'success': response.success,
-                            'message': response.message,
-                            'hint': response.hint,
-                            'gameState': response.game_state
-                        })
-                    }
-                except ValueError as e:
-                    # Handle validation errors from GuessRequest or input validation
-                    return {
-                        'statusCode': 400,
-                        'headers': {
-                            'Content-Type': 'application/json',
-                            'Access-Control-Allow-Origin': '*'
-                        },
-                        'body': json.dumps({'error': str(e)})
-                    }
-                except Exception as e:
-                    print(f"Submit guess error: {e}")
-                    return {
-                        'statusCode': 500,
-                        'headers': {
-                            'Content-Type': 'application/json',
-                            'Access-Control-Allow-Origin': '*'
-                        },
-                        'body': json.dumps({'error': 'Failed to process guess'})
-                    }
-            
-            elif http_method == 'POST' and path == '/give-up':
-                try:
-                    session_id = body.get('sessionId')
-                    if not session_id:
-                        return {
-                            'statusCode': 400,
-                            'headers': {
-                                'Content-Type': 'application/json',
-                                'Access-Control-Allow-Origin': '*'
-                            },
-                            'body': json.dumps({'error': 'Session ID is required'})
-                        }
-                    
-                    response = game_builder.give_up(session_id)
-                    return {
-                        'statusCode': 200,
-                        'headers': {
-                            'Content-Type': 'application/json',
-                            'Access-Control-Allow-Origin': '*',
-                            'Access-Control-Allow-Methods': 'POST, OPTIONS',
-                            'Access-Control-Allow-Headers': 'Content-Type'
-                        },
-                        'body': json.dumps({
-                            'message': response.message,
-                            'gameState': response.game_state
-                        })
-                    }
-                except Exception as e:
-                    print(f"Give up error: {e}")
-                    return {
-                        'statusCode': 500,
-                        'headers': {
-                            'Content-Type': 'application/json',
-                            'Access-Control-Allow-Origin': '*'
-                        },
-                        'body': json.dumps({'error': 'Failed to end game'})
-                    }
-            
-            elif http_method == 'OPTIONS':
-                # Handle CORS preflight
-                return {
-                    'statusCode': 200,
-                    'headers': {
-                        'Access-Control-Allow-Origin': '*',
-                        'Access-Control-Allow-Methods': 'POST, OPTIONS',
-                        'Access-Control-Allow-Headers': 'Content-Type'
-                    },
-                    'body': ''
-                }
-            
-            else:
-                return {
-                    'statusCode': 404,
-                    'headers': {
-                        'Content-Type': 'application/json',
-                        'Access-Control-Allow-Origin': '*'
-                    },
-                    'body': json.dumps({'error': 'Endpoint not found'})
-                }
-                
+            return handler(game_builder, body)
         except Exception as e:
-            print(f"Request routing error: {e}")
-            return {
-                'statusCode': 500,
-                'headers': {
-                    'Content-Type': 'application/json',
-                    'Access-Control-Allow-Origin': '*'
-                },
-                'body': json.dumps({'error': 'Internal routing error'})
-            }
+            logger.exception("Request routing error: %s", e)
+            return _json_response(500, {'error': 'Internal routing error'})
     
     except Exception as e:
         # Ultimate fallback for any unhandled errors
-        print(f"Critical lambda handler error: {e}")
-        return {
-            'statusCode': 500,
-            'headers': {
-                'Content-Type': 'application/json',
-                'Access-Control-Allow-Origin': '*'
-            },
-            'body': json.dumps({'error': 'Internal server error'})
-        }
\ No newline at end of file
+        logger.exception("Critical lambda handler error: %s", e)
+        return _json_response(500, {'error': 'Internal server error'})
\ No newline at end of file
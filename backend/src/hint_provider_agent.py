@@ -1,20 +1,116 @@
 """Hint Provider Agent for SynonymSeeker."""
 
 import os
-import json
 import re
-from typing import Dict, Any, Optional, List
+import logging
+import orjson
+from functools import cached_property
+from types import MappingProxyType
+from typing import Dict, Any, Optional, List, Tuple
+from rapidfuzz import process
+from rapidfuzz.distance import Levenshtein
 from strands import Agent, tool
 from strands.multiagent.a2a import A2AServer
 from src.models import HintRequest, HintResponse
 
 
+logger = logging.getLogger(__name__)
+
+# Same curated word sets as the Game Builder Agent, plus a few extra synonyms
+_SYNONYM_SETS = {
+    "happy": ("joyful", "cheerful", "glad", "pleased", "content", "delighted"),
+    "fast": ("quick", "rapid", "swift", "speedy", "hasty", "brisk"),
+    "big": ("large", "huge", "enormous", "massive", "giant", "vast"),
+    "smart": ("clever", "bright", "wise", "brilliant", "intelligent", "sharp"),
+    "cold": ("chilly", "freezing", "icy", "frigid", "frosty", "cool"),
+    "loud": ("noisy", "booming", "thunderous", "deafening", "blaring", "roaring"),
+    "small": ("tiny", "little", "miniature", "petite", "compact", "minute"),
+    "beautiful": ("gorgeous", "stunning", "lovely", "attractive", "pretty", "elegant")
+}
+
+
+def _max_edit_distance(word: str) -> int:
+    """Largest edit distance still treated as a misspelling of word (1 error per 3 characters)."""
+    return max(1, len(word) // 3)
+
+
+# Per target, each synonym with its length and allowed misspelling distance,
+# precomputed so misspelling checks don't recompute them per request
+_MISSPELLING_CANDIDATES = {
+    target: tuple((synonym, len(synonym), _max_edit_distance(synonym)) for synonym in synonyms)
+    for target, synonyms in _SYNONYM_SETS.items()
+}
+
+
+_VOCABULARY_HINTS = {
+    "happy": "Think of emotions that express joy or contentment.",
+    "fast": "Consider words that describe quick movement or speed.",
+    "big": "Look for words that describe large size or scale.",
+    "smart": "Think of words that describe intelligence or cleverness.",
+    "cold": "Consider words that describe low temperature or chilliness.",
+    "loud": "Look for words that describe high volume or noise.",
+    "small": "Think of words that describe tiny size or compactness.",
+    "beautiful": "Consider words that describe attractiveness or elegance."
+}
+
+# Words grouped into broad categories (emotion, size, speed, temperature); two
+# words are related concepts when they map to the same category
+_CONCEPT_CATEGORIES = (
+    ("happy", "sad", "angry", "excited", "calm", "worried"),
+    ("big", "small", "large", "tiny", "huge", "little"),
+    ("fast", "slow", "quick", "rapid", "sluggish"),
+    ("hot", "cold", "warm", "cool", "freezing", "boiling"),
+)
+_WORD_CATEGORIES = {
+    word: category
+    for category, words in enumerate(_CONCEPT_CATEGORIES)
+    for word in words
+}
+
+# Suffixes that change word form, stripped before comparing word roots:
+# quickly -> quick, happiness -> happi, running -> runn, walked -> walk
+_FORM_SUFFIXES = ('ly', 'ness', 'ing', 'ed')
+
+# Patterns that might indicate prompt injection attempts, combined into one
+# alternation so sanitizing an input is a single search
+_SUSPICIOUS_RE = re.compile('|'.join((
+    r'(?:ignore|forget|disregard).*(?:previous|above|instruction)',
+    r'(?:system|assistant|ai).*(?:prompt|instruction|role)',
+    r'(?:tell|show|reveal).*(?:secret|password|key)',
+    r'(?:execute|run|eval).*(?:code|script|command)',
+    r'(?:sql|database|table).*(?:select|insert|update|delete)',
+    r'\b(?:script|javascript|eval)\b',  # Individual injection keywords
+)), re.IGNORECASE)
+
+# Words never echoed back in a hint
+_NEGATIVE_WORDS = ("wrong", "bad", "stupid", "dumb", "terrible")
+
+_UNSAFE_CHARS_RE = re.compile(r'[^a-zA-Z\s\-]')
+# The same filter as a translate table, for the usual all-ASCII input
+_UNSAFE_ASCII_TABLE = str.maketrans({
+    c: None for c in map(chr, range(128)) if _UNSAFE_CHARS_RE.match(c)
+})
+
+
+def _clean_text(text: str) -> str:
+    """Drop everything but letters, whitespace and hyphens, then collapse whitespace."""
+    if text.isascii():
+        text = text.translate(_UNSAFE_ASCII_TABLE)
+    else:
+        text = _UNSAFE_CHARS_RE.sub('', text)
+    return ' '.join(text.split())
+
+
 class HintProviderAgent:
     """Secondary agent responsible for analyzing incorrect guesses and providing contextual feedback."""
     
-    def __init__(self):
-        """Initialize the Hint Provider Agent."""
-        self.agent = Agent(
+    @cached_property
+    def agent(self) -> Agent:
+        """Strands agent exposing the hint tools, built only when first used.
+        
+        lambda_handler calls the analysis methods directly, so API requests never pay for it.
+        """
+        return Agent(
             tools=[
                 self.analyze_guess_relationship,
                 self.detect_misspelling,
@@ -66,8 +162,9 @@ Response Format:
                 "reasoning": "Invalid input provided"
             }
         
-        guess_lower = guess.lower().strip()
-        target_lower = target_word.lower().strip()
+        # The sanitizer already strips whitespace, so lowercasing is the only normalization left
+        guess_lower = guess.lower()
+        target_lower = target_word.lower()
         
         # Prevent analysis of the target word itself
         if guess_lower == target_lower:
@@ -77,16 +174,16 @@ Response Format:
                 "reasoning": "Player submitted the target word itself"
             }
         
-        # Check for close misspellings of common synonyms
-        common_synonyms = self._get_common_synonyms(target_word)
-        for synonym in common_synonyms:
-            if self._is_close_misspelling(guess_lower, synonym.lower()):
-                return {
-                    "relationship_type": "misspelling",
-                    "confidence": 0.9,
-                    "reasoning": f"Close misspelling of '{synonym}'",
-                    "intended_word": synonym
-                }
+        # Check for close misspellings of common synonyms, taking the closest one
+        misspelling = self._find_misspelling(guess_lower, target_lower)
+        if misspelling:
+            synonym = misspelling[0]
+            return {
+                "relationship_type": "misspelling",
+                "confidence": 0.9,
+                "reasoning": f"Close misspelling of '{synonym}'",
+                "intended_word": synonym
+            }
         
         # Check for related concepts (same category/domain)
         if self._is_related_concept(guess_lower, target_lower):
@@ -134,22 +231,11 @@ Response Format:
                 "confidence": 0.0
             }
         
-        guess_lower = guess.lower().strip()
-        common_synonyms = self._get_common_synonyms(target_word)
+        guess_lower = guess.lower()
+        misspelling = self._find_misspelling(guess_lower, target_word.lower())
         
-        best_match = None
-        best_distance = float('inf')
-        
-        for synonym in common_synonyms:
-            distance = self._edit_distance(guess_lower, synonym.lower())
-            # Consider it a misspelling if edit distance is small relative to word length
-            max_distance = max(1, len(synonym) // 3)  # Allow 1 error per 3 characters
-            
-            if distance <= max_distance and distance < best_distance:
-                best_distance = distance
-                best_match = synonym
-        
-        if best_match:
+        if misspelling:
+            best_match, best_distance = misspelling
             return {
                 "is_misspelling": True,
                 "intended_word": best_match,
@@ -214,86 +300,58 @@ Response Format:
         else:  # unrelated
             hints = self._get_vocabulary_hints(target_display)
             # Avoid echoing negative words in hints
-            negative_words = ["wrong", "bad", "stupid", "dumb", "terrible"]
-            if any(word in guess_display.lower() for word in negative_words):
+            guess_display_lower = guess_display.lower()
+            if any(word in guess_display_lower for word in _NEGATIVE_WORDS):
                 return f"That word isn't related to '{target_display}'. {hints}"
             else:
                 return f"'{guess_display}' isn't related to '{target_display}'. {hints}"
     
-    def _get_common_synonyms(self, target_word: str) -> List[str]:
-        """Get common synonyms for the target word."""
-        # Use the same curated word sets as the Game Builder Agent
-        synonym_sets = {
-            "happy": ["joyful", "cheerful", "glad", "pleased", "content", "delighted"],
-            "fast": ["quick", "rapid", "swift", "speedy", "hasty", "brisk"],
-            "big": ["large", "huge", "enormous", "massive", "giant", "vast"],
-            "smart": ["clever", "bright", "wise", "brilliant", "intelligent", "sharp"],
-            "cold": ["chilly", "freezing", "icy", "frigid", "frosty", "cool"],
-            "loud": ["noisy", "booming", "thunderous", "deafening", "blaring", "roaring"],
-            "small": ["tiny", "little", "miniature", "petite", "compact", "minute"],
-            "beautiful": ["gorgeous", "stunning", "lovely", "attractive", "pretty", "elegant"]
+    def _find_misspelling(self, guess_lower: str, target_lower: str) -> Optional[Tuple[str, int]]:
+        """Find the synonym of target_lower closest to guess_lower, as (synonym, edit distance).
+        
+        Both words must already be normalized. Returns None when no synonym is
+        within its misspelling distance.
+        """
+        candidates = _MISSPELLING_CANDIDATES.get(target_lower, ())
+        
+        # Edit distance is at least the length difference, so synonyms that
+        # could never be within range are skipped before scoring
+        guess_length = len(guess_lower)
+        choices = {
+            index: synonym
+            for index, (synonym, length, max_distance) in enumerate(candidates)
+            if abs(guess_length - length) <= max_distance
         }
+        if not choices:
+            return None
+        
+        # Score every remaining synonym in one C call; results come back closest
+        # first, with ties in synonym order
+        matches = process.extract(
+            guess_lower,
+            choices,
+            scorer=Levenshtein.distance,
+            score_cutoff=max(candidates[index][2] for index in choices),
+            limit=None
+        )
+        for synonym, distance, index in matches:
+            if distance <= candidates[index][2]:
+                return synonym, distance
         
-        return synonym_sets.get(target_word.lower(), [])
-    
-    def _is_close_misspelling(self, guess: str, target: str) -> bool:
-        """Check if guess is a close misspelling of target."""
-        if abs(len(guess) - len(target)) > 2:
-            return False
-        
-        distance = self._edit_distance(guess, target)
-        max_distance = max(1, len(target) // 3)
-        return distance <= max_distance
-    
-    def _edit_distance(self, s1: str, s2: str) -> int:
-        """Calculate edit distance between two strings."""
-        if len(s1) < len(s2):
-            s1, s2 = s2, s1
-        
-        if len(s2) == 0:
-            return len(s1)
-        
-        previous_row = list(range(len(s2) + 1))
-        for i, c1 in enumerate(s1):
-            current_row = [i + 1]
-            for j, c2 in enumerate(s2):
-                insertions = previous_row[j + 1] + 1
-                deletions = current_row[j] + 1
-                substitutions = previous_row[j] + (c1 != c2)
-                current_row.append(min(insertions, deletions, substitutions))
-            previous_row = current_row
-        
-        return previous_row[-1]
+        return None
     
     def _is_related_concept(self, guess: str, target: str) -> bool:
         """Check if guess is a related concept to target."""
-        # Simple heuristic: check for common word patterns or categories
-        emotion_words = ["happy", "sad", "angry", "excited", "calm", "worried"]
-        size_words = ["big", "small", "large", "tiny", "huge", "little"]
-        speed_words = ["fast", "slow", "quick", "rapid", "sluggish"]
-        temperature_words = ["hot", "cold", "warm", "cool", "freezing", "boiling"]
-        
-        categories = [emotion_words, size_words, speed_words, temperature_words]
-        
-        for category in categories:
-            if target in category and guess in category:
-                return True
-        
-        return False
+        # Simple heuristic: both words belong to the same category
+        category = _WORD_CATEGORIES.get(target)
+        return category is not None and _WORD_CATEGORIES.get(guess) == category
     
     def _is_wrong_form(self, guess: str, target: str) -> bool:
         """Check if guess is wrong grammatical form of target."""
         # Simple heuristic: check for common suffixes that change word form
-        form_patterns = [
-            (r'ly$', r''),  # adverb to adjective: quickly -> quick
-            (r'ness$', r''),  # noun to adjective: happiness -> happy
-            (r'ing$', r''),  # gerund to verb: running -> run
-            (r'ed$', r''),  # past tense to present: walked -> walk
-        ]
-        
-        for pattern, replacement in form_patterns:
-            guess_root = re.sub(pattern, replacement, guess)
-            target_root = re.sub(pattern, replacement, target)
+        for suffix in _FORM_SUFFIXES:
+            guess_root = guess[:-len(suffix)] if guess.endswith(suffix) else guess
+            target_root = target[:-len(suffix)] if target.endswith(suffix) else target
             if guess_root == target_root or guess == target_root or guess_root == target:
                 return True
         
@@ -301,18 +359,7 @@ Response Format:
     
     def _get_vocabulary_hints(self, target_word: str) -> str:
         """Get vocabulary building hints for the target word."""
-        hints = {
-            "happy": "Think of emotions that express joy or contentment.",
-            "fast": "Consider words that describe quick movement or speed.",
-            "big": "Look for words that describe large size or scale.",
-            "smart": "Think of words that describe intelligence or cleverness.",
-            "cold": "Consider words that describe low temperature or chilliness.",
-            "loud": "Look for words that describe high volume or noise.",
-            "small": "Think of words that describe tiny size or compactness.",
-            "beautiful": "Consider words that describe attractiveness or elegance."
-        }
-        
-        return hints.get(target_word.lower(), f"Think of words that have a similar meaning to '{target_word}'.")
+        return _VOCABULARY_HINTS.get(target_word.lower(), f"Think of words that have a similar meaning to '{target_word}'.")
     
     def _sanitize_for_analysis(self, text: str) -> str:
         """Sanitize input for analysis to prevent prompt injection."""
@@ -327,26 +374,12 @@ Response Format:
             text = text[:50]
         
         # Check for suspicious patterns that might indicate injection attempts
-        suspicious_patterns = [
-            r'(ignore|forget|disregard).*(previous|above|instruction)',
-            r'(system|assistant|ai).*(prompt|instruction|role)',
-            r'(tell|show|reveal).*(secret|password|key)',
-            r'(execute|run|eval).*(code|script|command)',
-            r'(sql|database|table).*(select|insert|update|delete)',
-            r'\b(script|javascript|eval)\b',  # Individual injection keywords
-        ]
-        
-        for pattern in suspicious_patterns:
-            if re.search(pattern, text, re.IGNORECASE):
-                return ""  # Return empty string for suspicious input
+        if _SUSPICIOUS_RE.search(text):
+            return ""  # Return empty string for suspicious input
         
         # Remove non-alphabetic characters except spaces and hyphens
-        sanitized = re.sub(r'[^a-zA-Z\s\-]', '', text)
-        
-        # Remove excessive whitespace
-        sanitized = re.sub(r'\s+', ' ', sanitized).strip()
-        
-        return sanitized
+        # and remove excessive whitespace
+        return _clean_text(text)
     
     def _sanitize_for_display(self, text: str) -> str:
         """Sanitize text for safe display in hints."""
@@ -361,32 +394,21 @@ Response Format:
             text = text[:50]
         
         # Keep only safe characters for display
-        sanitized = re.sub(r'[^a-zA-Z\s\-]', '', text)
-        
-        # Remove excessive whitespace
-        sanitized = re.sub(r'\s+', ' ', sanitized).strip()
-        
-        return sanitized
+        # and remove excessive whitespace
+        return _clean_text(text)
     
     def analyze_hint_request(self, request: HintRequest) -> HintResponse:
         """Process a hint request and return structured response with error handling."""
         try:
-            # Analyze the guess relationship
+            # Analyze the guess relationship; this also finds the closest misspelled
+            # synonym, so the synonyms are only scored once per request
             analysis = self.analyze_guess_relationship(
                 request.guess, 
                 request.target_word, 
                 request.previous_guesses
             )
             
-            # Check for misspellings
-            misspelling_result = self.detect_misspelling(request.guess, request.target_word)
-            
             # Generate contextual hint
-            if misspelling_result["is_misspelling"]:
-                # Use misspelling analysis for hint generation
-                analysis["relationship_type"] = "misspelling"
-                analysis["intended_word"] = misspelling_result["intended_word"]
-            
             hint_text = self.generate_contextual_hint(request.guess, request.target_word, analysis)
             
             return HintResponse(
@@ -396,7 +418,7 @@ Response Format:
             )
             
         except Exception as e:
-            print(f"Error in hint analysis: {e}")
+            logger.warning("Error in hint analysis: %s", e)
             # Fallback response when analysis fails
             guess_clean = self._sanitize_for_display(request.guess)
             target_clean = self._sanitize_for_display(request.target_word)
@@ -427,11 +449,51 @@ Response Format:
         return a2a_server
 
 
+# CORS headers for successful responses and preflights; error responses only allow the origin.
+# Read-only, since each response gets its own copy
+_CORS_HEADERS = MappingProxyType({
+    'Access-Control-Allow-Origin': '*',
+    'Access-Control-Allow-Methods': 'POST, OPTIONS',
+    'Access-Control-Allow-Headers': 'Content-Type'
+})
+_JSON_HEADERS = MappingProxyType({'Content-Type': 'application/json', **_CORS_HEADERS})
+_ERROR_HEADERS = MappingProxyType({
+    'Content-Type': 'application/json',
+    'Access-Control-Allow-Origin': '*'
+})
+
+
+def _json_dumps(payload: Any) -> str:
+    """Serialize a response body with orjson (Lambda expects a str body)."""
+    return orjson.dumps(payload).decode()
+
+
+def _error_response(status_code: int, message: str) -> dict:
+    """Build a Lambda proxy error response with a JSON body."""
+    return {
+        'statusCode': status_code,
+        'headers': dict(_ERROR_HEADERS),
+        'body': _json_dumps({'error': message})
+    }
+
+
+# Agent shared across warm Lambda invocations
+_hint_provider: Optional[HintProviderAgent] = None
+
+
+def _get_hint_provider() -> HintProviderAgent:
+    """Get the shared Hint Provider Agent, creating it on first use."""
+    global _hint_provider
+    if _hint_provider is None:
+        _hint_provider = HintProviderAgent()
+    return _hint_provider
+
+
 def lambda_handler(event: dict, context: Any) -> dict:
     """AWS Lambda handler for Hint Provider Agent."""
     try:
         # Initialize agent
-        hint_provider = HintProviderAgent()
+        hint_provider = _get_hint_provider()
         
         # Parse request
         http_method = event.get('httpMethod', 'POST')
@@ -441,27 +503,13 @@ def lambda_handler(event: dict, context: Any) -> dict:
         # Request size validation (Lambda has 6MB limit, we'll use 1MB for safety)
         MAX_REQUEST_SIZE = 1024 * 1024  # 1MB
         if isinstance(body, str) and len(body.encode('utf-8')) > MAX_REQUEST_SIZE:
-            return {
-                'statusCode': 413,
-                'headers': {
-                    'Content-Type': 'application/json',
-                    'Access-Control-Allow-Origin': '*'
-                },
-                'body': json.dumps({'error': 'Request too large'})
-            }
+            return _error_response(413, 'Request too large')
         
         if isinstance(body, str):
             try:
-                body = json.loads(body) if body else {}
-            except json.JSONDecodeError:
-                return {
-                    'statusCode': 400,
-                    'headers': {
-                        'Content-Type': 'application/json',
-                        'Access-Control-Allow-Origin': '*'
-                    },
-                    'body': json.dumps({'error': 'Invalid JSON in request body'})
-                }
+                body = orjson.loads(body) if body else {}
+            except orjson.JSONDecodeError:
+                return _error_response(400, 'Invalid JSON in request body')
         
         # Route requests
         if http_method == 'POST' and path == '/analyze-hint':
@@ -471,14 +519,7 @@ def lambda_handler(event: dict, context: Any) -> dict:
                 target_word = body.get('target_word', '')
                 
                 if not guess or not target_word:
-                    return {
-                        'statusCode': 400,
-                        'headers': {
-                            'Content-Type': 'application/json',
-                            'Access-Control-Allow-Origin': '*'
-                        },
-                        'body': json.dumps({'error': 'Both guess and target_word are required'})
-                    }
+                    return _error_response(400, 'Both guess and target_word are required')
                 
                 # Create hint request from body
                 request = HintRequest(
@@ -491,13 +532,8 @@ def lambda_handler(event: dict, context: Any) -> dict:
                 
                 return {
                     'statusCode': 200,
-                    'headers': {
-                        'Content-Type': 'application/json',
-                        'Access-Control-Allow-Origin': '*',
-                        'Access-Control-Allow-Methods': 'POST, OPTIONS',
-                        'Access-Control-Allow-Headers': 'Content-Type'
-                    },
-                    'body': json.dumps({
+                    'headers': dict(_JSON_HEADERS),
+                    'body': _json_dumps({
                         'hintText': response.hint_text,
                         'analysisType': response.analysis_type,
                         'confidence': response.confidence
@@ -505,45 +541,20 @@ def lambda_handler(event: dict, context: Any) -> dict:
                 }
             except ValueError as e:
                 # Handle validation errors from HintRequest
-                return {
-                    'statusCode': 400,
-                    'headers': {
-                        'Content-Type': 'application/json',
-                        'Access-Control-Allow-Origin': '*'
-                    },
-                    'body': json.dumps({'error': str(e)})
-                }
+                return _error_response(400, str(e))
         
         elif http_method == 'OPTIONS':
             # Handle CORS preflight
             return {
                 'statusCode': 200,
-                'headers': {
-                    'Access-Control-Allow-Origin': '*',
-                    'Access-Control-Allow-Methods': 'POST, OPTIONS',
-                    'Access-Control-Allow-Headers': 'Content-Type'
-                },
+                'headers': dict(_CORS_HEADERS),
                 'body': ''
             }
         
         else:
-            return {
-                'statusCode': 404,
-                'headers': {
-                    'Content-Type': 'application/json',
-                    'Access-Control-Allow-Origin': '*'
-                },
-                'body': json.dumps({'error': 'Not found'})
-            }
+            return _error_response(404, 'Not found')
     
     except Exception as e:
         # Log error for debugging but don't expose internal details
-        print(f"Internal error in hint provider: {e}")
-        return {
-            'statusCode': 500,
-            'headers': {
-                'Content-Type': 'application/json',
-                'Access-Control-Allow-Origin': '*'
-            },
-            'body': json.dumps({'error': 'Internal server error'})
-        }
\ No newline at end of file
+        logger.exception("Internal error in hint provider: %s", e)
+        return _error_response(500, 'Internal server error')
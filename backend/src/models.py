@@ -1,11 +1,15 @@
 """Data models for SynonymSeeker backend."""
 
-from dataclasses import dataclass
-from typing import List, Optional
+from dataclasses import dataclass, field
+from typing import List, Optional, Set, Tuple
 from enum import Enum
 import re
 
 
+class ValidationError(ValueError):
+    """Raised when client-supplied input is invalid (reported back as a 400)."""
+
+
 class GameStatus(Enum):
     """Game status enumeration."""
     ACTIVE = "active"
@@ -13,7 +17,7 @@ class GameStatus(Enum):
     GIVEN_UP = "given-up"
 
 
-@dataclass
+@dataclass(slots=True)
 class SynonymSlot:
     """Represents a synonym slot in the game."""
     word: Optional[str]
@@ -28,7 +32,7 @@ class SynonymSlot:
             raise ValueError("Word length must match letter count")
 
 
-@dataclass
+@dataclass(slots=True)
 class GameSession:
     """Represents a complete game session."""
     session_id: str
@@ -38,11 +42,19 @@ class GameSession:
     status: GameStatus
     guessed_words: List[str]
     
+    # Server-side state, never exposed to the client
+    _actual_synonyms: Optional[List[str]] = field(default=None, init=False, repr=False, compare=False)
+    _synonyms_lower: Optional[Tuple[str, ...]] = field(default=None, init=False, repr=False, compare=False)
+    _target_lower: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    _guessed_lower: Optional[Set[str]] = field(default=None, init=False, repr=False, compare=False)
+    _synonym_length_bits: Optional[int] = field(default=None, init=False, repr=False, compare=False)
+    _last_activity: Optional[float] = field(default=None, init=False, repr=False, compare=False)
+    
     def __post_init__(self):
         """Validate game session data."""
         if not self.session_id:
             raise ValueError("Session ID cannot be empty")
-        if not self.target_word or not re.match(r'^[a-zA-Z]+$', self.target_word):
+        if not self.target_word or not (self.target_word.isascii() and self.target_word.isalpha()):
             raise ValueError("Target word must contain only letters")
         if len(self.synonyms) != 4:
             raise ValueError("Game must have exactly 4 synonym slots")
@@ -60,15 +72,24 @@ class GameSession:
         self.guess_count += 1
 
 
+# Patterns in a raw guess that might indicate injection attempts
+_SUSPICIOUS_GUESS_RE = re.compile('|'.join((
+    r'[<>{}[\]\\]',  # HTML/XML/JSON brackets
+    r'[;|&$`]',      # Shell command separators
+    r'(?:script|javascript|eval|function)',  # Script-related keywords
+    r'(?:select|insert|update|delete|drop)',  # SQL keywords
+)), re.IGNORECASE)
+
+
 # API Request/Response Models
 
-@dataclass
+@dataclass(slots=True)
 class StartGameRequest:
     """Request to start a new game."""
     pass  # No parameters needed
 
 
-@dataclass
+@dataclass(slots=True)
 class StartGameResponse:
     """Response when starting a new game."""
     session_id: str
@@ -84,7 +105,7 @@ class StartGameResponse:
             raise ValueError("Must have exactly 4 synonym slots")
 
 
-@dataclass
+@dataclass(slots=True)
 class GuessRequest:
     """Request to submit a guess."""
     session_id: str
@@ -93,7 +114,7 @@ class GuessRequest:
     def __post_init__(self):
         """Validate and sanitize guess request."""
         if not self.session_id:
-            raise ValueError("Session ID cannot be empty")
+            raise ValidationError("Session ID cannot be empty")
         
         # Store original guess for error messages
         original_guess = self.guess
@@ -121,46 +142,38 @@ class GuessRequest:
         """Comprehensive input validation with specific error messages."""
         # Check for empty input first
         if not original or not original.strip():
-            raise ValueError("Guess cannot be empty")
+            raise ValidationError("Guess cannot be empty")
         
         # Check for multiple words (spaces in original input) - high priority
         if ' ' in original.strip():
-            raise ValueError("Please enter only one word")
+            raise ValidationError("Please enter only one word")
         
         # Check for excessive length (before sanitization to catch attempts to bypass)
         if len(original) > 50:
-            raise ValueError("Input too long (maximum 50 characters)")
+            raise ValidationError("Input too long (maximum 50 characters)")
         
         # Check for suspicious patterns that might indicate injection attempts - before other checks
-        suspicious_patterns = [
-            r'[<>{}[\]\\]',  # HTML/XML/JSON brackets
-            r'[;|&$`]',      # Shell command separators
-            r'(script|javascript|eval|function)',  # Script-related keywords
-            r'(select|insert|update|delete|drop)',  # SQL keywords
-        ]
-        
-        for pattern in suspicious_patterns:
-            if re.search(pattern, original, re.IGNORECASE):
-                raise ValueError("Invalid characters detected in input")
+        if _SUSPICIOUS_GUESS_RE.search(original):
+            raise ValidationError("Invalid characters detected in input")
         
         # Check if input became empty after sanitization
         if not sanitized:
-            raise ValueError("Guess must contain at least one letter")
+            raise ValidationError("Guess must contain at least one letter")
         
         # Check sanitized length
         if len(sanitized) > 50:
-            raise ValueError("Word too long (maximum 50 letters)")
+            raise ValidationError("Word too long (maximum 50 letters)")
         
         # Check minimum length
         if len(sanitized) < 1:
-            raise ValueError("Word too short (minimum 1 letter)")
+            raise ValidationError("Word too short (minimum 1 letter)")
         
         # Ensure only alphabetic characters remain (allow Unicode letters)
         if not sanitized.isalpha():
-            raise ValueError("Word must contain only letters")
+            raise ValidationError("Word must contain only letters")
 
 
-@dataclass
+@dataclass(slots=True)
 class GuessResponse:
     """Response to a guess submission."""
     success: bool
@@ -174,7 +187,7 @@ class GuessResponse:
             raise ValueError("Response message cannot be empty")
 
 
-@dataclass
+@dataclass(slots=True)
 class GiveUpRequest:
     """Request to give up the current game."""
     session_id: str
@@ -185,7 +198,7 @@ class GiveUpRequest:
             raise ValueError("Session ID cannot be empty")
 
 
-@dataclass
+@dataclass(slots=True)
 class GiveUpResponse:
     """Response when giving up a game."""
     message: str
@@ -199,7 +212,7 @@ class GiveUpResponse:
 
 # Agent Communication Models
 
-@dataclass
+@dataclass(slots=True)
 class HintRequest:
     """Request for hint analysis from Hint Provider agent."""
     guess: str
@@ -224,18 +237,25 @@ class HintRequest:
         return sanitized[:50]  # Limit length
 
 
-@dataclass
+# Every analysis type the Hint Provider can report, including its error fallback
+_ANALYSIS_TYPES = frozenset({
+    "misspelling", "related", "unrelated", "wrong_form", "target_word",
+    "invalid_input", "error_fallback"
+})
+
+
+@dataclass(slots=True)
 class HintResponse:
     """Response from Hint Provider agent."""
     hint_text: str
-    analysis_type: str  # "misspelling", "related", "unrelated"
+    analysis_type: str  # One of _ANALYSIS_TYPES
     confidence: float
     
     def __post_init__(self):
         """Validate hint response."""
         if not self.hint_text:
             raise ValueError("Hint text cannot be empty")
-        if self.analysis_type not in ["misspelling", "related", "unrelated"]:
+        if self.analysis_type not in _ANALYSIS_TYPES:
             raise ValueError("Invalid analysis type")
         if not 0.0 <= self.confidence <= 1.0:
             raise ValueError("Confidence must be between 0.0 and 1.0")
\ No newline at end of file
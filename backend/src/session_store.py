@@ -0,0 +1,259 @@
+"""Session storage backends for the Game Builder Agent."""
+
+import os
+import zlib
+import threading
+import orjson
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Callable, List, Optional
+
+from .models import GameSession, GameStatus, SynonymSlot
+
+
+SESSION_TTL = 30 * 60  # 30 minutes
+
+# Stored payloads start with a one-byte tag: raw JSON, or zlib-compressed JSON for
+# payloads large enough that compression pays for its CPU cost
+COMPRESSION_THRESHOLD = 2048  # bytes
+_RAW_TAG = b"R"
+_ZLIB_TAG = b"Z"
+
+
+def session_to_json(session: GameSession) -> bytes:
+    """Serialize a session, keeping its actual synonyms but not the derived lookups."""
+    return orjson.dumps({
+        "session_id": session.session_id,
+        "target_word": session.target_word,
+        "synonyms": [
+            {"word": slot.word, "letter_count": slot.letter_count, "found": slot.found}
+            for slot in session.synonyms
+        ],
+        "guess_count": session.guess_count,
+        "status": session.status.value if session.status else None,
+        "guessed_words": session.guessed_words,
+        "actual_synonyms": session._actual_synonyms,
+        "last_activity": session._last_activity
+    })
+
+
+def session_from_json(data: bytes) -> GameSession:
+    """Rebuild a session serialized by session_to_json."""
+    payload = orjson.loads(data)
+    
+    synonyms = []
+    for slot_data in payload["synonyms"]:
+        # Found words may be misspellings, so set them after length validation
+        slot = SynonymSlot(word=None, letter_count=slot_data["letter_count"])
+        slot.word = slot_data["word"]
+        slot.found = slot_data["found"]
+        synonyms.append(slot)
+    
+    session = GameSession(
+        session_id=payload["session_id"],
+        target_word=payload["target_word"],
+        synonyms=synonyms,
+        guess_count=payload["guess_count"],
+        status=GameStatus(payload["status"]) if payload["status"] else None,
+        guessed_words=payload["guessed_words"]
+    )
+    session._actual_synonyms = payload["actual_synonyms"]
+    session._last_activity = payload["last_activity"]
+    return session
+
+
+def encode_session(session: GameSession) -> bytes:
+    """Serialize a session for storage, compressing large payloads."""
+    raw = session_to_json(session)
+    if len(raw) >= COMPRESSION_THRESHOLD:
+        return _ZLIB_TAG + zlib.compress(raw, 1)
+    return _RAW_TAG + raw
+
+
+def decode_session(data: bytes) -> GameSession:
+    """Rebuild a session stored by encode_session."""
+    tag, payload = data[:1], data[1:]
+    if tag == _ZLIB_TAG:
+        return session_from_json(zlib.decompress(payload))
+    if tag == _RAW_TAG:
+        return session_from_json(payload)
+    # Untagged JSON written before payloads were tagged
+    return session_from_json(data)
+
+
+class SessionStore(ABC):
+    """Interface for game session storage."""
+    
+    # True when the backend expires idle sessions itself, so no cleanup sweep is needed
+    expires_natively = False
+    
+    @abstractmethod
+    def get(self, session_id: str) -> Optional[GameSession]:
+        """Return the stored session, or None if it does not exist."""
+    
+    @abstractmethod
+    def put(self, session_id: str, session: GameSession) -> None:
+        """Store (or overwrite) a session."""
+    
+    @abstractmethod
+    def delete(self, session_id: str) -> None:
+        """Remove a session if it exists."""
+    
+    def touch(self, session_id: str) -> None:
+        """Record activity on a session. Backends that track recency override this."""
+        pass
+    
+    def sweep(self, is_expired: Callable[[GameSession], bool], limit: Optional[int] = None) -> List[str]:
+        """Remove sessions for which is_expired returns True and return their IDs.
+        
+        At most limit sessions are removed per call when a limit is given.
+        Backends that expire sessions natively (e.g. Redis TTL) don't need to override this.
+        """
+        return []
+    
+    def __contains__(self, session_id: str) -> bool:
+        return self.get(session_id) is not None
+
+
+class InMemorySessionStore(OrderedDict, SessionStore):
+    """Per-process session storage (for development and single-container use).
+    
+    Sessions are kept in least-recently-active order, so a sweep only has to look
+    at the front of the store until it reaches a session that is still active.
+    """
+    
+    def put(self, session_id: str, session: GameSession) -> None:
+        self[session_id] = session
+    
+    def delete(self, session_id: str) -> None:
+        self.pop(session_id, None)
+    
+    def touch(self, session_id: str) -> None:
+        try:
+            self.move_to_end(session_id)
+        except KeyError:
+            # Not stored yet (new game) or removed concurrently
+            pass
+    
+    def sweep(self, is_expired: Callable[[GameSession], bool], limit: Optional[int] = None) -> List[str]:
+        expired = []
+        while self and (limit is None or len(expired) < limit):
+            session_id, session = next(iter(self.items()))
+            if not is_expired(session):
+                break
+            self.pop(session_id, None)
+            expired.append(session_id)
+        return expired
+
+
+class ShardedSessionStore(SessionStore):
+    """In-memory session storage split into independently locked shards.
+    
+    For threaded servers: requests for different sessions usually land on
+    different shards, so they don't contend for one lock, and a sweep only
+    holds one shard's lock at a time.
+    """
+    
+    def __init__(self, shard_count: int = 16):
+        if shard_count < 1 or shard_count & (shard_count - 1):
+            raise ValueError("shard_count must be a power of two")
+        self._shards = tuple(InMemorySessionStore() for _ in range(shard_count))
+        self._shard_locks = tuple(threading.Lock() for _ in range(shard_count))
+        self._shard_mask = shard_count - 1
+    
+    def _shard_index(self, session_id: str) -> int:
+        return hash(session_id) & self._shard_mask
+    
+    def get(self, session_id: str) -> Optional[GameSession]:
+        index = self._shard_index(session_id)
+        with self._shard_locks[index]:
+            return self._shards[index].get(session_id)
+    
+    def put(self, session_id: str, session: GameSession) -> None:
+        index = self._shard_index(session_id)
+        with self._shard_locks[index]:
+            self._shards[index].put(session_id, session)
+    
+    def delete(self, session_id: str) -> None:
+        index = self._shard_index(session_id)
+        with self._shard_locks[index]:
+            self._shards[index].delete(session_id)
+    
+    def touch(self, session_id: str) -> None:
+        index = self._shard_index(session_id)
+        with self._shard_locks[index]:
+            self._shards[index].touch(session_id)
+    
+    def sweep(self, is_expired: Callable[[GameSession], bool], limit: Optional[int] = None) -> List[str]:
+        expired = []
+        for lock, shard in zip(self._shard_locks, self._shards):
+            remaining = None if limit is None else limit - len(expired)
+            if remaining == 0:
+                break
+            with lock:
+                expired.extend(shard.sweep(is_expired, remaining))
+        return expired
+    
+    def __len__(self) -> int:
+        return sum(len(shard) for shard in self._shards)
+
+
+class RedisSessionStore(SessionStore):
+    """Redis-backed session storage shared across Lambda containers.
+    
+    Sessions are stored as JSON with a TTL that is refreshed on every save,
+    so Redis expires idle games and no cleanup sweep is needed.
+    """
+    
+    KEY_PREFIX = "ss:"
+    expires_natively = True
+    
+    def __init__(self, url: str, ttl: int = SESSION_TTL):
+        import redis  # Only required when the Redis backend is selected
+        
+        pool = redis.ConnectionPool.from_url(url, socket_keepalive=True)
+        self.client = redis.Redis(connection_pool=pool)
+        self.ttl = ttl
+    
+    def _key(self, session_id: str) -> str:
+        return f"{self.KEY_PREFIX}{session_id}"
+    
+    def get(self, session_id: str) -> Optional[GameSession]:
+        data = self.client.get(self._key(session_id))
+        if data is None:
+            return None
+        return decode_session(data)
+    
+    def put(self, session_id: str, session: GameSession) -> None:
+        self.client.setex(self._key(session_id), self.ttl, encode_session(session))
+    
+    def delete(self, session_id: str) -> None:
+        self.client.delete(self._key(session_id))
+    
+    def __contains__(self, session_id: str) -> bool:
+        return bool(self.client.exists(self._key(session_id)))
+    
+    def __len__(self) -> int:
+        return sum(1 for _ in self.client.scan_iter(match=f"{self.KEY_PREFIX}*"))
+
+
+def create_session_store() -> SessionStore:
+    """Create the session store selected by the SESSION_BACKEND environment variable."""
+    backend = os.environ.get('SESSION_BACKEND', 'memory').lower()
+    
+    if backend == 'redis':
+        redis_url = os.environ.get('REDIS_URL', 'redis://localhost:6379/0')
+        try:
+            return RedisSessionStore(redis_url)
+        except ImportError as e:
+            raise ValueError(
+                "SESSION_BACKEND=redis requires the redis package (pip install 'redis>=4.0')"
+            ) from e
+    
+    if backend == 'sharded':
+        return ShardedSessionStore()
+    
+    if backend != 'memory':
+        raise ValueError(f"Unknown session backend: {backend}")
+    
+    return InMemorySessionStore()
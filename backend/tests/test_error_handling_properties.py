@@ -1,7 +1,7 @@
 """Property-based tests for error handling and service failure resilience."""
 
 import pytest
-from hypothesis import given, strategies as st, assume
+from hypothesis import given, example, strategies as st, assume
 from unittest.mock import Mock, patch
 import json
 import uuid
@@ -286,6 +286,7 @@ class TestErrorHandlingProperties:
                 assert session.status == GameStatus.ACTIVE
     
     @given(st.text(min_size=1, max_size=20).filter(lambda x: x.strip() and x.isalpha()))
+    @example("joyfull")  # Reaches the misspelling scan
     def test_property_16_service_failure_resilience_hint_provider_errors(self, guess):
         """
         Feature: synonym-seeker, Property 16: Service Failure Resilience
@@ -296,39 +297,43 @@ class TestErrorHandlingProperties:
         # Given: Hint provider methods that may fail
         target_word = "happy"
         
-        # When: Various hint provider methods encounter errors
-        with patch.object(self.hint_provider, 'analyze_guess_relationship') as mock_analyze:
-            with patch.object(self.hint_provider, 'detect_misspelling') as mock_detect:
-                with patch.object(self.hint_provider, 'generate_contextual_hint') as mock_generate:
+        # When: Each stage of hint analysis fails in turn (the misspelling scan runs
+        # inside analyze_guess_relationship, so it gets its own failure)
+        failures = (
+            ('analyze_guess_relationship', "Analysis service down"),
+            ('_find_misspelling', "Detection service error"),
+            ('generate_contextual_hint', "Generation service failed"),
+        )
+        for method_name, message in failures:
+            with patch.object(self.hint_provider, method_name, side_effect=Exception(message)) as mock_failure:
+                
+                # Then: Should handle gracefully
+                try:
+                    from src.models import HintRequest
+                    request = HintRequest(
+                        guess=guess,
+                        target_word=target_word,
+                        previous_guesses=[]
+                    )
+                    response = self.hint_provider.analyze_hint_request(request)
+                    
+                    # Should provide some response even if services fail
+                    assert response is not None
+                    assert hasattr(response, 'hint_text')
+                    assert isinstance(response.hint_text, str)
+                    
+                    # A failure that was actually reached should produce the fallback hint
+                    if mock_failure.called:
+                        assert response.analysis_type == "error_fallback"
                     
-                    # Simulate different types of failures
-                    mock_analyze.side_effect = Exception("Analysis service down")
-                    mock_detect.side_effect = Exception("Detection service error")
-                    mock_generate.side_effect = Exception("Generation service failed")
+                    # Should not expose error details
+                    hint_lower = response.hint_text.lower()
+                    assert "exception" not in hint_lower
+                    assert "service down" not in hint_lower
+                    assert "error" not in hint_lower or "try" in hint_lower
                     
-                    # Then: Should handle gracefully
-                    try:
-                        from src.models import HintRequest
-                        request = HintRequest(
-                            guess=guess,
-                            target_word=target_word,
-                            previous_guesses=[]
-                        )
-                        response = self.hint_provider.analyze_hint_request(request)
-                        
-                        # Should provide some response even if services fail
-                        assert response is not None
-                        assert hasattr(response, 'hint_text')
-                        assert isinstance(response.hint_text, str)
-                        
-                        # Should not expose error details
-                        hint_lower = response.hint_text.lower()
-                        assert "exception" not in hint_lower
-                        assert "service down" not in hint_lower
-                        assert "error" not in hint_lower or "try" in hint_lower
-                        
-                    except Exception as e:
-                        # If it does raise an exception, it should be handled gracefully
-                        # by the calling code (game builder agent)
-                        assert isinstance(e, (ValueError, RuntimeError))
-                        assert "internal" not in str(e).lower()
\ No newline at end of file
+                except Exception as e:
+                    # If it does raise an exception, it should be handled gracefully
+                    # by the calling code (game builder agent)
+                    assert isinstance(e, (ValueError, RuntimeError))
+                    assert "internal" not in str(e).lower()
\ No newline at end of file
@@ -1,12 +1,13 @@
 """Tests for Game Builder Agent."""
 
 import os
+import json
 import pytest
 import asyncio
 from unittest.mock import patch, AsyncMock, MagicMock
 from hypothesis import given, strategies as st
 from src.game_builder_agent import GameBuilderAgent
-from src.models import GuessRequest, GameStatus
+from src.models import GuessRequest, GameStatus, GameSession, SynonymSlot
 
 
 class TestGameBuilderAgent:
@@ -26,6 +27,19 @@ class TestGameBuilderAgent:
         assert len(self.agent.agent.tool_names) == 3  # generate_word_puzzle, validate_guess, request_hint_analysis
         assert self.agent.sessions == {}
     
+    def test_strands_agent_built_lazily(self):
+        """
+        Given: A fresh GameBuilderAgent
+        When: Playing a game through the direct API methods
+        Then: Should not construct the Strands agent until it is accessed
+        """
+        game_builder = GameBuilderAgent()
+        response = game_builder.start_new_game()
+        game_builder.give_up(response.session_id)
+        
+        assert 'agent' not in vars(game_builder)
+        assert game_builder.agent is game_builder.agent
+    
     def test_start_new_game(self):
         """
         Given: A request to start a new game
@@ -48,6 +62,41 @@ class TestGameBuilderAgent:
         assert len(session.synonyms) == 4
         assert session.status == GameStatus.ACTIVE
     
+    def test_curated_puzzles_prebuilt_and_valid(self):
+        """
+        Given: The curated puzzle table built at import
+        When: Generating curated puzzles
+        Then: Should hand out the shared, already-valid entries with immutable synonym tuples
+        """
+        from src.game_builder_agent import _CURATED_PUZZLES
+        
+        for puzzle in _CURATED_PUZZLES:
+            assert isinstance(puzzle["synonyms"], tuple)
+            assert self.agent._validate_puzzle_data(puzzle)
+            assert list(puzzle["slot_lengths"]) == [
+                syn["letter_count"] for syn in puzzle["synonyms"]
+            ]
+        
+        generated = self.agent._generate_from_curated_words()
+        assert any(generated is puzzle for puzzle in _CURATED_PUZZLES)
+    
+    def test_curated_game_slots_not_shared(self):
+        """
+        Given: Two games started from the same curated puzzle
+        When: A caller mutates the first response's slot layout
+        Then: The second game's slots should be a fresh, unaffected list
+        """
+        from src.game_builder_agent import _CURATED_PUZZLES
+        
+        puzzle = _CURATED_PUZZLES[0]
+        with patch.object(self.agent, 'generate_word_puzzle', return_value=puzzle):
+            first = self.agent.start_new_game()
+            first.synonym_slots[0]["letterCount"] = 99
+            second = self.agent.start_new_game()
+        
+        assert isinstance(second.synonym_slots, list)
+        assert [slot["letterCount"] for slot in second.synonym_slots] == list(puzzle["slot_lengths"])
+    
     @given(st.integers(min_value=1, max_value=100))
     def test_property_15_word_generation_quality(self, seed):
         """
@@ -186,6 +235,72 @@ class TestGameBuilderAgent:
         result = self.agent.validate_guess("joyfl", "happy", synonyms)  # Missing 'u'
         assert result is True
     
+    def test_is_close_match_uses_true_edit_distance(self):
+        """
+        Given: Misspellings that shift characters out of position
+        When: Checking for a close match
+        Then: Should align insertions/transpositions instead of comparing positionally
+        """
+        assert self.agent._is_close_match("xjoyful", "joyful") is True  # Leading insertion
+        assert self.agent._is_close_match("plaesed", "pleased") is True  # Transposition
+        assert self.agent._is_close_match("cheerful", "cheerful") is True
+        assert self.agent._is_close_match("car", "cheerful") is False
+        assert self.agent._is_close_match("pleasure", "pleased") is False  # Three edits
+        assert self.agent._is_close_match("sad", "glad") is False  # Short words allow one edit
+    
+    def test_is_close_match_with_shared_prefix_and_suffix(self):
+        """
+        Given: Misspellings that differ only in the middle of a long word
+        When: Checking for a close match
+        Then: Should judge only the differing middle, however long the shared affixes are
+        """
+        assert self.agent._is_close_match("briliant", "brilliant") is True
+        assert self.agent._is_close_match("brillliant", "brilliant") is True
+        assert self.agent._is_close_match("brixxxiant", "brilliant") is False
+    
+    def test_find_close_match_returns_synonym_index(self):
+        """
+        Given: A list of lowercase synonyms
+        When: Looking up the closest misspelling match
+        Then: Should return the matching index, or None if nothing is close enough
+        """
+        synonyms = ["joyful", "cheerful", "glad", "pleased"]
+        
+        assert self.agent._find_close_match("cheerfull", synonyms) == 1
+        assert self.agent._find_close_match("plesed", synonyms) == 3
+        assert self.agent._find_close_match("sad", synonyms) is None
+    
+    def test_validate_guess_with_index_prefers_exact_match(self):
+        """
+        Given: Synonyms where a guess is exact for one and close to another
+        When: Validating the guess with its index
+        Then: Should return the exact match's index, or None for unrelated words
+        """
+        synonyms = ("glad", "joyful", "gladly", "pleased")
+        
+        assert self.agent._validate_guess_with_index("gladly", synonyms) == 2
+        assert self.agent._validate_guess_with_index("joyfull", synonyms) == 1
+        assert self.agent._validate_guess_with_index("sad", synonyms) is None
+    
+    def test_validate_guess_with_index_length_bitmap(self):
+        """
+        Given: A session whose synonyms have 4, 6, 7 and 8 letters
+        When: Validating guesses with the session's synonym length bitmap
+        Then: Should reject far-off lengths up front and still find in-range matches
+        """
+        response = self.agent.start_new_game()
+        session = self.agent.sessions[response.session_id]
+        self.agent._cache_session_synonyms(session, ["glad", "joyful", "pleased", "cheerful"])
+        synonyms, bits = session._synonyms_lower, session._synonym_length_bits
+        
+        assert bits == (1 << 4) | (1 << 6) | (1 << 7) | (1 << 8)
+        assert self.agent._validate_guess_with_index("gld", synonyms, bits) == 0
+        assert self.agent._validate_guess_with_index("cheerfull", synonyms, bits) == 3
+        with patch.object(self.agent, '_find_close_match') as mock_find:
+            assert self.agent._validate_guess_with_index("a", synonyms, bits) is None
+            assert self.agent._validate_guess_with_index("extraordinarily", synonyms, bits) is None
+            mock_find.assert_not_called()
+    
     def test_submit_guess_correct(self):
         """
         Given: A correct guess for an active game
@@ -270,6 +385,37 @@ class TestGameBuilderAgent:
         assert "already guessed" in guess_response.message
         assert guess_response.game_state["guessCount"] == 2  # Count still increments
     
+    def test_submit_guess_duplicate_ignores_case(self):
+        """
+        Given: A guess already made with different capitalization
+        When: Submitting it again
+        Then: Should reject it as a duplicate using the session's cached guess set
+        """
+        response = self.agent.start_new_game()
+        session_id = response.session_id
+        
+        self.agent.submit_guess(GuessRequest(session_id=session_id, guess="wrong"))
+        guess_response = self.agent.submit_guess(GuessRequest(session_id=session_id, guess="WRONG"))
+        
+        assert guess_response.success is False
+        assert "already guessed" in guess_response.message
+        assert self.agent.sessions[session_id]._guessed_lower == {"wrong", response.target_word.lower()}
+    
+    def test_submit_guess_target_word_repeated(self):
+        """
+        Given: An active game
+        When: Guessing the target word twice
+        Then: Should give the target-word message both times, not the duplicate message
+        """
+        response = self.agent.start_new_game()
+        request = GuessRequest(session_id=response.session_id, guess=response.target_word)
+        
+        for expected_count in (1, 2):
+            guess_response = self.agent.submit_guess(request)
+            assert guess_response.success is False
+            assert "can't use the target word" in guess_response.message
+            assert guess_response.game_state["guessCount"] == expected_count
+    
     def test_give_up_functionality(self):
         """
         Given: An active game session
@@ -364,39 +510,348 @@ class TestGameBuilderAgent:
             assert indicator not in hint_lower, f"Hint should not contain error indicator: {indicator}"
     
     @patch.dict(os.environ, {'HINT_PROVIDER_A2A_URL': 'http://localhost:9001'})
-    @patch('src.game_builder_agent.asyncio.run')
-    def test_a2a_communication_with_mock(self, mock_asyncio_run):
+    @patch('src.game_builder_agent.asyncio.run_coroutine_threadsafe')
+    def test_a2a_communication_with_mock(self, mock_run_coroutine):
         """
         Given: A2A communication is configured
         When: Requesting hint analysis
         Then: Should attempt A2A communication and handle responses
         """
         # Mock successful A2A response
-        mock_asyncio_run.return_value = "Great guess! Try thinking of words that express joy."
+        mock_run_coroutine.return_value.result.return_value = "Great guess! Try thinking of words that express joy."
         
         hint = self.agent.request_hint_analysis("sad", "happy")
         
         # Should have attempted A2A communication
-        mock_asyncio_run.assert_called_once()
+        mock_run_coroutine.assert_called_once()
         assert hint == "Great guess! Try thinking of words that express joy."
     
     @patch.dict(os.environ, {'HINT_PROVIDER_A2A_URL': 'http://localhost:9001'})
-    @patch('src.game_builder_agent.asyncio.run')
-    def test_a2a_communication_fallback(self, mock_asyncio_run):
+    @patch('src.game_builder_agent.asyncio.run_coroutine_threadsafe')
+    def test_a2a_communication_fallback(self, mock_run_coroutine):
         """
         Given: A2A communication fails
         When: Requesting hint analysis
         Then: Should fallback to basic hint generation
         """
         # Mock A2A communication failure
-        mock_asyncio_run.side_effect = Exception("Connection failed")
+        mock_run_coroutine.side_effect = Exception("Connection failed")
         
         hint = self.agent.request_hint_analysis("sad", "happy")
         
         # Should have attempted A2A communication
-        mock_asyncio_run.assert_called_once()
+        mock_run_coroutine.assert_called_once()
         
         # Should fallback to basic hint
         assert isinstance(hint, str)
         assert len(hint) > 0
-        assert "sad" in hint or "happy" in hint
\ No newline at end of file
+        assert "sad" in hint or "happy" in hint
+    
+    @patch('src.game_builder_agent.ClientFactory')
+    @patch('src.game_builder_agent.A2ACardResolver')
+    def test_a2a_client_reused_across_requests(self, mock_resolver, mock_factory):
+        """
+        Given: A2A communication with the Hint Provider
+        When: Requesting several hints
+        Then: Should resolve the agent card once and reuse the client on the background loop
+        """
+        mock_resolver.return_value.get_agent_card = AsyncMock(return_value=MagicMock())
+        
+        async def send_message(msg, context=None):
+            yield "Think of words that express joy."
+        
+        mock_factory.return_value.create.return_value.send_message = send_message
+        
+        first = self.agent._request_hint_via_a2a("sad", "happy", "http://localhost:9001")
+        second = self.agent._request_hint_via_a2a("car", "happy", "http://localhost:9001")
+        
+        assert first == second == "Think of words that express joy."
+        mock_resolver.return_value.get_agent_card.assert_awaited_once()
+        mock_factory.return_value.create.assert_called_once()
+    
+    @patch('src.game_builder_agent.ClientFactory')
+    @patch('src.game_builder_agent.A2ACardResolver')
+    def test_a2a_agent_card_refreshed_after_ttl(self, mock_resolver, mock_factory):
+        """
+        Given: An A2A client whose agent card is older than the cache TTL
+        When: Requesting another hint
+        Then: Should resolve the agent card again but keep the same HTTP connection pool
+        """
+        from src.game_builder_agent import AGENT_CARD_TTL
+        
+        url = "http://localhost:9001"
+        mock_resolver.return_value.get_agent_card = AsyncMock(return_value=MagicMock())
+        
+        async def send_message(msg, context=None):
+            yield "Think of words that express joy."
+        
+        mock_factory.return_value.create.return_value.send_message = send_message
+        
+        self.agent._request_hint_via_a2a("sad", "happy", url)
+        http_client = self.agent._a2a_http_clients[url]
+        fetched_at, client = self.agent._a2a_clients[url]
+        self.agent._a2a_clients[url] = (fetched_at - AGENT_CARD_TTL - 1, client)
+        
+        self.agent._request_hint_via_a2a("car", "happy", url)
+        
+        assert mock_resolver.return_value.get_agent_card.await_count == 2
+        assert self.agent._a2a_http_clients[url] is http_client
+    
+    def test_lambda_handler_reuses_agent_across_invocations(self):
+        """
+        Given: A game started through the Lambda handler
+        When: Submitting a guess in a later invocation
+        Then: Should find the session on the shared agent instead of a fresh one
+        """
+        from src.game_builder_agent import lambda_handler
+        
+        def make_event(path, body):
+            return {
+                'requestContext': {'http': {'method': 'POST', 'path': path}},
+                'body': json.dumps(body)
+            }
+        
+        start = lambda_handler(make_event('/start-game', {}), {})
+        session_id = json.loads(start['body'])['sessionId']
+        
+        guess = lambda_handler(make_event('/submit-guess', {'sessionId': session_id, 'guess': 'wrong'}), {})
+        body = json.loads(guess['body'])
+        
+        assert guess['statusCode'] == 200
+        assert body['gameState']['guessCount'] == 1
+    
+    def test_lambda_handler_rejects_invalid_json(self):
+        """
+        Given: A request body that is not valid JSON
+        When: Calling the Lambda handler
+        Then: Should return 400 with a JSON error body
+        """
+        from src.game_builder_agent import lambda_handler
+        
+        event = {
+            'requestContext': {'http': {'method': 'POST', 'path': '/submit-guess'}},
+            'body': '{"sessionId": '
+        }
+        response = lambda_handler(event, {})
+        
+        assert response['statusCode'] == 400
+        assert json.loads(response['body']) == {'error': 'Invalid JSON in request body'}
+    
+    def test_exceeds_request_size_counts_utf8_bytes(self):
+        """
+        Given: Request bodies around the size limit
+        When: Checking the request size
+        Then: Should measure UTF-8 bytes, not characters
+        """
+        from src.game_builder_agent import MAX_REQUEST_SIZE, _exceeds_request_size
+        
+        assert _exceeds_request_size("a" * MAX_REQUEST_SIZE) is False
+        assert _exceeds_request_size("a" * (MAX_REQUEST_SIZE + 1)) is True
+        assert _exceeds_request_size("é" * (MAX_REQUEST_SIZE // 2)) is False
+        assert _exceeds_request_size("é" * (MAX_REQUEST_SIZE // 2 + 1)) is True
+    
+    def test_lambda_handler_routes_and_cors(self):
+        """
+        Given: Preflight, unknown-route and give-up requests
+        When: Calling the Lambda handler
+        Then: Should dispatch by method and path and send CORS headers on every response
+        """
+        from src.game_builder_agent import lambda_handler
+        
+        def make_event(method, path, body=''):
+            return {'requestContext': {'http': {'method': method, 'path': path}}, 'body': body}
+        
+        preflight = lambda_handler(make_event('OPTIONS', '/submit-guess'), {})
+        missing = lambda_handler(make_event('GET', '/start-game'), {})
+        give_up = lambda_handler(make_event('POST', '/give-up', json.dumps({})), {})
+        
+        assert preflight['statusCode'] == 200
+        assert preflight['body'] == ''
+        assert missing['statusCode'] == 404
+        assert give_up['statusCode'] == 400
+        assert json.loads(give_up['body']) == {'error': 'Session ID is required'}
+        for response in (preflight, missing, give_up):
+            assert response['headers']['Access-Control-Allow-Origin'] == '*'
+    
+    def test_emergency_hint_strips_non_letters(self):
+        """
+        Given: Inputs containing digits, punctuation and accented letters
+        When: Generating the emergency fallback hint
+        Then: Should keep only letters, including non-ASCII ones
+        """
+        hint = self.agent._generate_emergency_fallback_hint("caf3é!<b>", "hap_py")
+        
+        assert hint.startswith("'caféb' is not a synonym of 'happy'.")
+        assert self.agent._generate_emergency_fallback_hint("123", "happy") == "Please enter a valid word to get a hint."
+        
+        # Numeric characters that aren't decimal digits are not letters either
+        assert self.agent._generate_emergency_fallback_hint("x²y", "happy").startswith("'xy' ")
+    
+    @patch.dict(os.environ, {'HINT_PROVIDER_URL': 'http://localhost:9002'})
+    def test_direct_http_reuses_shared_client(self):
+        """
+        Given: Direct HTTP communication with the Hint Provider
+        When: Requesting several hints
+        Then: Should post through the one shared client instead of opening a new one per call
+        """
+        from src.game_builder_agent import _get_http_client
+        
+        assert _get_http_client() is _get_http_client()
+        
+        mock_client = MagicMock()
+        mock_client.post.return_value.status_code = 200
+        mock_client.post.return_value.json.return_value = {"hintText": "Think of joy."}
+        
+        with patch('src.game_builder_agent._get_http_client', return_value=mock_client):
+            first = self.agent._try_direct_http_communication("sad", "happy")
+            second = self.agent._try_direct_http_communication("car", "happy")
+        
+        assert first == second == "Think of joy."
+        assert mock_client.post.call_count == 2
+        assert mock_client.post.call_args.args[0] == "http://localhost:9002/analyze-hint"
+    
+    def test_start_new_game_falls_back_without_retrying(self):
+        """
+        Given: Puzzle generation that returns invalid data
+        When: Starting a new game
+        Then: Should create an emergency game after a single attempt, without sleeping
+        """
+        with patch.object(self.agent, 'generate_word_puzzle', return_value={}) as mock_generate, \
+                patch('time.sleep') as mock_sleep:
+            response = self.agent.start_new_game()
+        
+        assert mock_generate.call_count == 1
+        mock_sleep.assert_not_called()
+        assert response.session_id.startswith("emergency-")
+        assert response.target_word == "happy"
+        assert self.agent.sessions[response.session_id]._last_activity is not None
+    
+    def test_recover_session_synonyms(self):
+        """
+        Given: Sessions whose cached synonyms were lost
+        When: Recovering synonyms from the target word
+        Then: Should return the curated set, or placeholders for unknown targets
+        """
+        known = GameSession(
+            session_id="recover-1", target_word="Happy",
+            synonyms=[SynonymSlot(word=None, letter_count=n) for n in (6, 8, 4, 7)],
+            guess_count=0, status=GameStatus.ACTIVE, guessed_words=[]
+        )
+        unknown = GameSession(
+            session_id="recover-2", target_word="zebra",
+            synonyms=[SynonymSlot(word=None, letter_count=5) for _ in range(4)],
+            guess_count=0, status=GameStatus.ACTIVE, guessed_words=[]
+        )
+        
+        assert self.agent._recover_session_synonyms(known) == ["joyful", "cheerful", "glad", "pleased"]
+        assert self.agent._recover_session_synonyms(unknown) == ["word1", "word2", "word3", "word4"]
+    
+    def test_fallback_guess_validation(self):
+        """
+        Given: A session, with and without its cached synonyms
+        When: Validating guesses through the fallback path
+        Then: Should return the matched synonym index for exact and close matches only
+        """
+        session = GameSession(
+            session_id="fallback-1", target_word="happy",
+            synonyms=[SynonymSlot(word=None, letter_count=n) for n in (6, 8, 4, 7)],
+            guess_count=0, status=GameStatus.ACTIVE, guessed_words=[]
+        )
+        
+        # Nothing cached yet, so synonyms are recovered from the target word
+        assert self.agent._fallback_guess_validation("glad", session) == 2
+        
+        self.agent._cache_session_synonyms(session, ["Joyful", "Cheerful", "Glad", "Pleased"])
+        
+        assert self.agent._fallback_guess_validation("pleased", session) == 3
+        assert self.agent._fallback_guess_validation("cheerfull", session) == 1
+        assert self.agent._fallback_guess_validation("happy", session) is None
+        assert self.agent._fallback_guess_validation("table", session) is None
+    
+    def test_sanitize_and_validate_guess(self):
+        """
+        Given: Guesses with surrounding whitespace, punctuation, spaces and digits
+        When: Sanitizing them
+        Then: Should accept letters with hyphens and apostrophes and explain each rejection
+        """
+        assert self.agent._sanitize_and_validate_guess("  well-known ") == "well-known"
+        assert self.agent._sanitize_and_validate_guess("o'clock") == "o'clock"
+        assert self.agent._sanitize_and_validate_guess("café") == "café"
+        
+        with pytest.raises(ValueError, match="only one word"):
+            self.agent._sanitize_and_validate_guess("very happy")
+        with pytest.raises(ValueError, match="only letters"):
+            self.agent._sanitize_and_validate_guess("h4ppy")
+        with pytest.raises(ValueError, match="only letters"):
+            self.agent._sanitize_and_validate_guess("-'")
+        with pytest.raises(ValueError, match="maximum 50 characters"):
+            self.agent._sanitize_and_validate_guess("a" * 51)
+    
+    def test_lambda_handler_skips_body_parse_for_start_game(self):
+        """
+        Given: Requests with bodies that are not valid JSON
+        When: Calling routes that ignore the body, or no route at all
+        Then: Should not parse the body, so no JSON error is returned
+        """
+        from src.game_builder_agent import lambda_handler
+        
+        start = lambda_handler({
+            'requestContext': {'http': {'method': 'POST', 'path': '/start-game'}},
+            'body': 'not json'
+        }, {})
+        missing = lambda_handler({
+            'requestContext': {'http': {'method': 'POST', 'path': '/unknown'}},
+            'body': 'not json'
+        }, {})
+        
+        assert start['statusCode'] == 200
+        assert 'sessionId' in json.loads(start['body'])
+        assert missing['statusCode'] == 404
+    
+    def test_lambda_handler_rejection_responses_not_shared(self):
+        """
+        Given: Requests rejected before reaching a route handler
+        When: A caller adds a header to one rejection response
+        Then: Later rejection and preflight responses should be unaffected
+        """
+        from src.game_builder_agent import lambda_handler
+        
+        not_found = {'requestContext': {'http': {'method': 'GET', 'path': '/missing'}}, 'body': ''}
+        preflight = {'requestContext': {'http': {'method': 'OPTIONS', 'path': '/missing'}}, 'body': ''}
+        first = lambda_handler(not_found, {})
+        first['headers']['X-Injected'] = 'yes'
+        second = lambda_handler(not_found, {})
+        options = lambda_handler(preflight, {})
+        
+        assert second is not first
+        assert 'X-Injected' not in second['headers']
+        assert 'X-Injected' not in options['headers']
+        assert second['statusCode'] == 404
+        assert isinstance(second['body'], str)
+        assert json.loads(second['body']) == {'error': 'Endpoint not found'}
+        assert options['statusCode'] == 200
+        assert options['headers']['Access-Control-Allow-Origin'] == '*'
+    
+    def test_submit_guess_handler_separates_client_and_server_errors(self):
+        """
+        Given: Submit-guess requests with invalid input, and an internal ValueError
+        When: Calling the Lambda handler
+        Then: Should return 400 for validation errors but 500 without details for internal ones
+        """
+        from src.game_builder_agent import lambda_handler, _get_game_builder
+        
+        def submit(body):
+            return lambda_handler({
+                'requestContext': {'http': {'method': 'POST', 'path': '/submit-guess'}},
+                'body': json.dumps(body)
+            }, {})
+        
+        invalid = submit({'sessionId': 'abc', 'guess': 'two words'})
+        assert invalid['statusCode'] == 400
+        assert json.loads(invalid['body']) == {'error': 'Please enter only one word'}
+        
+        with patch.object(_get_game_builder(), 'submit_guess', side_effect=ValueError("internal detail")):
+            failed = submit({'sessionId': 'abc', 'guess': 'joyful'})
+        
+        assert failed['statusCode'] == 500
+        assert 'internal detail' not in failed['body']
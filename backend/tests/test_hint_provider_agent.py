@@ -165,43 +165,37 @@ class TestHintProviderAgent:
         assert response.analysis_type in ["misspelling", "related", "unrelated", "wrong_form", "target_word"]
         assert 0.0 <= response.confidence <= 1.0
     
-    def test_edit_distance_calculation(self):
+    def test_analyze_hint_request_scores_synonyms_once(self):
         """
-        Given: Two strings with known edit distance
-        When: Calculating edit distance
-        Then: Should return correct distance
+        Given: A guess that misspells one of several nearby synonyms
+        When: Processing the hint request
+        Then: Should suggest the closest synonym after a single scoring pass
         """
-        # Test exact match
-        assert self.agent._edit_distance("hello", "hello") == 0
+        from unittest.mock import patch
         
-        # Test single substitution
-        assert self.agent._edit_distance("hello", "hallo") == 1
+        request = HintRequest(guess="broaring", target_word="loud", previous_guesses=[])
         
-        # Test single insertion
-        assert self.agent._edit_distance("hello", "helloo") == 1
+        with patch.object(self.agent, '_find_misspelling', wraps=self.agent._find_misspelling) as mock_find:
+            response = self.agent.analyze_hint_request(request)
         
-        # Test single deletion
-        assert self.agent._edit_distance("hello", "hell") == 1
-        
-        # Test multiple operations
-        assert self.agent._edit_distance("kitten", "sitting") == 3
+        assert mock_find.call_count == 1
+        assert response.analysis_type == "misspelling"
+        assert response.confidence == 0.9
+        assert "'roaring'" in response.hint_text
     
-    def test_get_common_synonyms(self):
+    def test_detect_misspelling_prefers_closest_synonym(self):
         """
-        Given: A target word
-        When: Getting common synonyms
-        Then: Should return appropriate synonym list
+        Given: A guess within range of more than one synonym
+        When: Detecting misspelling
+        Then: Should pick the synonym with the smallest edit distance
         """
-        synonyms = self.agent._get_common_synonyms("happy")
+        result = self.agent.detect_misspelling("broaring", "loud")  # 2 from 'blaring', 1 from 'roaring'
         
-        assert isinstance(synonyms, list)
-        assert len(synonyms) > 0
-        assert "joyful" in synonyms
-        assert "cheerful" in synonyms
+        assert result["intended_word"] == "roaring"
+        assert result["edit_distance"] == 1
         
-        # Test unknown word
-        unknown_synonyms = self.agent._get_common_synonyms("unknown")
-        assert unknown_synonyms == []
+        # Far longer than any synonym, so every candidate is skipped by length
+        assert self.agent.detect_misspelling("enormouslyhuge", "big")["is_misspelling"] is False
     
     def test_is_related_concept(self):
         """
@@ -221,6 +215,48 @@ class TestHintProviderAgent:
         # Unrelated words
         assert self.agent._is_related_concept("car", "tree") is False
     
+    def test_is_wrong_form(self):
+        """
+        Given: Words that may be other grammatical forms of the target
+        When: Checking for a wrong word form
+        Then: Should match words that differ only by a form-changing suffix
+        """
+        assert self.agent._is_wrong_form("quickly", "quick") is True
+        assert self.agent._is_wrong_form("loud", "loudness") is True
+        assert self.agent._is_wrong_form("booming", "boomed") is False
+        assert self.agent._is_wrong_form("walked", "walk") is True
+        assert self.agent._is_wrong_form("car", "happy") is False
+    
+    def test_get_vocabulary_hints(self):
+        """
+        Given: Known and unknown target words
+        When: Getting vocabulary hints
+        Then: Should return the curated hint or a generic one naming the word
+        """
+        assert self.agent._get_vocabulary_hints("Happy") == "Think of emotions that express joy or contentment."
+        assert "'zebra'" in self.agent._get_vocabulary_hints("zebra")
+    
+    def test_sanitize_for_analysis_rejects_suspicious_input(self):
+        """
+        Given: Inputs matching any of the injection patterns, and a plain guess
+        When: Sanitizing them for analysis
+        Then: Suspicious inputs should be blanked and the plain guess kept
+        """
+        for text in ("Ignore all previous", "SYSTEM prompt", "reveal the key",
+                     "run this code", "sql select", "eval"):
+            assert self.agent._sanitize_for_analysis(text) == ""
+        
+        assert self.agent._sanitize_for_analysis("  cheer-ful  ") == "cheer-ful"
+    
+    def test_sanitize_for_display_strips_unsafe_characters(self):
+        """
+        Given: ASCII and non-ASCII text with digits, punctuation and runs of whitespace
+        When: Sanitizing it for display
+        Then: Should keep letters and hyphens with single spaces between words
+        """
+        assert self.agent._sanitize_for_display("happy<b>1  \t-go!") == "happyb -go"
+        assert self.agent._sanitize_for_display("naïve  café!") == "nave caf"
+    
     @given(st.text(alphabet=st.characters(whitelist_categories=('Lu', 'Ll')), min_size=1, max_size=20))
     def test_property_7_hint_generation_quality(self, guess):
         """
@@ -314,6 +350,49 @@ class TestHintProviderAgent:
         assert 'analysisType' in body
         assert 'confidence' in body
     
+    def test_lambda_handler_reuses_agent_across_invocations(self):
+        """
+        Given: Several Lambda invocations in the same warm container
+        When: Processing hint requests
+        Then: Should reuse one Hint Provider without building its Strands agent
+        """
+        from unittest.mock import patch
+        import src.hint_provider_agent as hint_module
+        
+        event = {
+            'httpMethod': 'POST',
+            'path': '/analyze-hint',
+            'body': json.dumps({'guess': 'sad', 'target_word': 'happy'})
+        }
+        
+        with patch.object(hint_module, '_hint_provider', None), \
+                patch.object(hint_module, 'HintProviderAgent', wraps=hint_module.HintProviderAgent) as mock_cls:
+            first = hint_module.lambda_handler(event, {})
+            second = hint_module.lambda_handler(event, {})
+            provider = hint_module._hint_provider
+        
+        assert first['statusCode'] == second['statusCode'] == 200
+        assert mock_cls.call_count == 1
+        assert 'agent' not in vars(provider)  # Strands agent never built
+    
+    def test_lambda_handler_rejects_invalid_json(self):
+        """
+        Given: A hint request body that is not valid JSON
+        When: Processing the event
+        Then: Should return 400 with a JSON error body
+        """
+        event = {
+            'httpMethod': 'POST',
+            'path': '/analyze-hint',
+            'body': '{"guess": '
+        }
+        
+        from src.hint_provider_agent import lambda_handler
+        response = lambda_handler(event, {})
+        
+        assert response['statusCode'] == 400
+        assert json.loads(response['body']) == {'error': 'Invalid JSON in request body'}
+    
     def test_lambda_handler_cors(self):
         """
         Given: A CORS preflight request
@@ -332,6 +411,24 @@ class TestHintProviderAgent:
         assert response['headers']['Access-Control-Allow-Origin'] == '*'
         assert 'POST' in response['headers']['Access-Control-Allow-Methods']
     
+    def test_lambda_handler_headers_not_shared(self):
+        """
+        Given: Two CORS preflight responses and two error responses
+        When: A caller adds a header to the first of each
+        Then: The second response should not see it
+        """
+        from src.hint_provider_agent import lambda_handler
+        
+        preflight = {'httpMethod': 'OPTIONS', 'path': '/analyze-hint'}
+        missing = {'httpMethod': 'GET', 'path': '/unknown'}
+        for event in (preflight, missing):
+            first = lambda_handler(event, {})
+            first['headers']['X-Injected'] = 'yes'
+            second = lambda_handler(event, {})
+            
+            assert 'X-Injected' not in second['headers']
+            assert second['headers']['Access-Control-Allow-Origin'] == '*'
+    
     def test_lambda_handler_not_found(self):
         """
         Given: A request to unknown endpoint
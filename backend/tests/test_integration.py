@@ -345,8 +345,8 @@ class TestExternalServiceIntegration:
         request = GuessRequest(session_id=session_id, guess="wrong")
         
         # Mock A2A communication to test integration
-        with patch('src.game_builder_agent.asyncio.run') as mock_asyncio:
-            mock_asyncio.return_value = "This is a hint from A2A communication."
+        with patch('src.game_builder_agent.asyncio.run_coroutine_threadsafe') as mock_asyncio:
+            mock_asyncio.return_value.result.return_value = "This is a hint from A2A communication."
             
             response = self.game_builder.submit_guess(request)
             
@@ -370,7 +370,7 @@ class TestExternalServiceIntegration:
         # When: Submit incorrect guess with A2A failure
         request = GuessRequest(session_id=session_id, guess="wrong")
         
-        with patch('src.game_builder_agent.asyncio.run') as mock_asyncio:
+        with patch('src.game_builder_agent.asyncio.run_coroutine_threadsafe') as mock_asyncio:
             mock_asyncio.side_effect = Exception("A2A communication failed")
             
             response = self.game_builder.submit_guess(request)
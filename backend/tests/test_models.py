@@ -3,7 +3,7 @@
 import pytest
 from src.models import (
     GameStatus, SynonymSlot, GameSession, StartGameResponse,
-    GuessRequest, GuessResponse, HintRequest, HintResponse
+    GuessRequest, GuessResponse, HintRequest, HintResponse, ValidationError
 )
 
 
@@ -83,6 +83,25 @@ class TestGameSession:
         assert session.guess_count == 0
         assert session.status == GameStatus.ACTIVE
     
+    def test_session_uses_slots(self):
+        """
+        Given: A valid game session
+        When: Inspecting its storage
+        Then: It should have no per-instance dict and default server-side state to None
+        """
+        session = GameSession(
+            session_id="test-123",
+            target_word="happy",
+            synonyms=[SynonymSlot(word=None, letter_count=n) for n in (4, 6, 7, 8)],
+            guess_count=0,
+            status=GameStatus.ACTIVE,
+            guessed_words=[]
+        )
+        assert not hasattr(session, '__dict__')
+        assert not hasattr(session.synonyms[0], '__dict__')
+        assert session._actual_synonyms is None
+        assert session._guessed_lower is None
+    
     def test_empty_session_id(self):
         """
         Given: Empty session ID
@@ -106,6 +125,9 @@ class TestGameSession:
         
         with pytest.raises(ValueError, match="Target word must contain only letters"):
             GameSession("test", "happy123", synonyms, 0, GameStatus.ACTIVE, [])
+        
+        with pytest.raises(ValueError, match="Target word must contain only letters"):
+            GameSession("test", "café", synonyms, 0, GameStatus.ACTIVE, [])
     
     def test_wrong_synonym_count(self):
         """
@@ -235,6 +257,27 @@ class TestGuessRequest:
         long_guess = "a" * 51
         with pytest.raises(ValueError, match="Input too long \\(maximum 50 characters\\)"):
             GuessRequest(session_id="test", guess=long_guess)
+    
+    def test_invalid_guess_raises_validation_error(self):
+        """
+        Given: Invalid client input
+        When: Creating a GuessRequest
+        Then: It should raise ValidationError, which is still a ValueError
+        """
+        with pytest.raises(ValidationError, match="Please enter only one word"):
+            GuessRequest(session_id="test", guess="two words")
+        
+        assert issubclass(ValidationError, ValueError)
+    
+    def test_suspicious_guess_rejected(self):
+        """
+        Given: Guesses containing brackets, shell separators, or script/SQL keywords
+        When: Creating a GuessRequest
+        Then: It should reject each of them as invalid characters
+        """
+        for guess in ("<happy>", "joy;", "JavaScript", "dropped"):
+            with pytest.raises(ValidationError, match="Invalid characters detected"):
+                GuessRequest(session_id="test", guess=guess)
 
 
 class TestHintRequest:
@@ -323,6 +366,16 @@ class TestHintResponse:
                 confidence=0.5
             )
     
+    def test_all_reported_analysis_types_accepted(self):
+        """
+        Given: Each analysis type the Hint Provider reports, including its error fallback
+        When: Creating a HintResponse
+        Then: It should be accepted
+        """
+        for analysis_type in ("misspelling", "related", "unrelated", "wrong_form",
+                              "target_word", "invalid_input", "error_fallback"):
+            assert HintResponse("Test hint", analysis_type, 0.5).analysis_type == analysis_type
+    
     def test_invalid_confidence_range(self):
         """
         Given: Confidence outside 0.0-1.0 range
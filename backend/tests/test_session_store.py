@@ -0,0 +1,387 @@
+"""Tests for session storage backends."""
+
+import time
+import pytest
+from unittest.mock import patch, MagicMock
+from src.session_store import (
+    InMemorySessionStore, RedisSessionStore, SessionStore, ShardedSessionStore, SESSION_TTL, COMPRESSION_THRESHOLD,
+    create_session_store, decode_session, encode_session, session_from_json, session_to_json
+)
+from src.game_builder_agent import GameBuilderAgent
+from src.models import GameSession, SynonymSlot, GameStatus
+
+
+def make_session(session_id: str = "session-1") -> GameSession:
+    """Create a minimal valid game session."""
+    return GameSession(
+        session_id=session_id,
+        target_word="happy",
+        synonyms=[SynonymSlot(word=None, letter_count=n) for n in (4, 6, 7, 8)],
+        guess_count=0,
+        status=GameStatus.ACTIVE,
+        guessed_words=[]
+    )
+
+
+class TestInMemorySessionStore:
+    """Test the in-process session store."""
+    
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.store = InMemorySessionStore()
+    
+    def test_put_get_delete(self):
+        """
+        Given: An empty in-memory store
+        When: Storing, reading and deleting a session
+        Then: Should behave like the plain dict it replaces
+        """
+        session = make_session()
+        self.store.put(session.session_id, session)
+        
+        assert session.session_id in self.store
+        assert self.store.get(session.session_id) is session
+        assert self.store[session.session_id] is session
+        
+        self.store.delete(session.session_id)
+        self.store.delete(session.session_id)  # Deleting twice is harmless
+        
+        assert self.store.get(session.session_id) is None
+        assert self.store == {}
+    
+    def test_sweep_removes_only_expired_sessions(self):
+        """
+        Given: A store with an expired and an active session
+        When: Sweeping with an expiry predicate
+        Then: Should remove and report only the expired session
+        """
+        self.store.put("old", make_session("old"))
+        self.store.put("new", make_session("new"))
+        
+        expired = self.store.sweep(lambda session: session.session_id == "old")
+        
+        assert expired == ["old"]
+        assert list(self.store) == ["new"]
+    
+    def test_touch_moves_session_to_back(self):
+        """
+        Given: Sessions stored oldest first
+        When: Touching the oldest session, then sweeping everything except it
+        Then: Should order sessions by recency and stop at the first active session
+        """
+        for session_id in ("a", "b", "c"):
+            self.store.put(session_id, make_session(session_id))
+        
+        self.store.touch("a")
+        self.store.touch("missing")  # Ignored
+        checked = []
+        
+        def is_expired(session):
+            checked.append(session.session_id)
+            return session.session_id != "a"
+        
+        assert list(self.store) == ["b", "c", "a"]
+        assert self.store.sweep(is_expired) == ["b", "c"]
+        assert checked == ["b", "c", "a"]
+        assert list(self.store) == ["a"]
+
+
+    def test_sweep_respects_limit(self):
+        """
+        Given: A store with several expired sessions
+        When: Sweeping with a batch limit
+        Then: Should remove at most that many, oldest first
+        """
+        for session_id in ("a", "b", "c"):
+            self.store.put(session_id, make_session(session_id))
+        
+        assert self.store.sweep(lambda session: True, limit=2) == ["a", "b"]
+        assert list(self.store) == ["c"]
+    
+    def test_incomplete_store_cannot_be_created(self):
+        """
+        Given: A SessionStore subclass that doesn't implement delete
+        When: Instantiating it, and the in-memory store
+        Then: The incomplete one should be rejected while the in-memory one uses dict lookups
+        """
+        class IncompleteStore(SessionStore):
+            def get(self, session_id):
+                return None
+            
+            def put(self, session_id, session):
+                pass
+        
+        with pytest.raises(TypeError):
+            IncompleteStore()
+        
+        assert InMemorySessionStore.get is dict.get
+        assert self.store.get("missing") is None
+
+
+class TestShardedSessionStore:
+    """Test the lock-striped in-memory session store."""
+    
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.store = ShardedSessionStore(shard_count=4)
+    
+    def test_put_get_delete_across_shards(self):
+        """
+        Given: An empty sharded store
+        When: Storing, reading and deleting many sessions
+        Then: Should spread them over the shards and find each one again
+        """
+        session_ids = [f"session-{i}" for i in range(50)]
+        for session_id in session_ids:
+            self.store.put(session_id, make_session(session_id))
+        
+        assert len(self.store) == 50
+        assert sum(1 for shard in self.store._shards if shard) > 1
+        assert all(self.store.get(session_id).session_id == session_id for session_id in session_ids)
+        
+        self.store.delete("session-0")
+        self.store.delete("session-0")  # Deleting twice is harmless
+        
+        assert "session-0" not in self.store
+        assert len(self.store) == 49
+    
+    def test_sweep_visits_every_shard(self):
+        """
+        Given: Expired and active sessions spread over the shards
+        When: Sweeping with an expiry predicate
+        Then: Should remove every expired session and keep the rest
+        """
+        for i in range(20):
+            self.store.put(f"old-{i}", make_session(f"old-{i}"))
+        self.store.put("new", make_session("new"))
+        
+        expired = self.store.sweep(lambda session: session.session_id.startswith("old-"))
+        
+        assert sorted(expired) == sorted(f"old-{i}" for i in range(20))
+        assert len(self.store) == 1
+        assert "new" in self.store
+    
+    def test_concurrent_puts(self):
+        """
+        Given: Several threads storing sessions at once
+        When: All threads finish
+        Then: Should keep every session
+        """
+        import threading
+        
+        def worker(prefix):
+            for i in range(200):
+                self.store.put(f"{prefix}-{i}", make_session(f"{prefix}-{i}"))
+                self.store.touch(f"{prefix}-{i}")
+        
+        threads = [threading.Thread(target=worker, args=(f"t{n}",)) for n in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        assert len(self.store) == 800
+    
+    def test_sweep_limit_spans_shards(self):
+        """
+        Given: Expired sessions spread over the shards
+        When: Sweeping with a batch limit
+        Then: Should stop once the limit is reached
+        """
+        for i in range(20):
+            self.store.put(f"old-{i}", make_session(f"old-{i}"))
+        
+        assert len(self.store.sweep(lambda session: True, limit=7)) == 7
+        assert len(self.store) == 13
+    
+    def test_shard_count_must_be_power_of_two(self):
+        """
+        Given: A shard count that cannot be used as a bit mask
+        When: Creating the store
+        Then: Should raise ValueError
+        """
+        with pytest.raises(ValueError):
+            ShardedSessionStore(shard_count=10)
+
+
+class TestRedisSessionStore:
+    """Test the Redis session store against a mocked client."""
+    
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.store = RedisSessionStore.__new__(RedisSessionStore)
+        self.store.client = MagicMock()
+        self.store.ttl = SESSION_TTL
+    
+    def test_put_sets_prefixed_key_with_ttl(self):
+        """
+        Given: A Redis-backed store
+        When: Storing a session
+        Then: Should write the session as JSON under the ss: prefix with the session TTL
+        """
+        session = make_session()
+        self.store.put(session.session_id, session)
+        
+        key, ttl, data = self.store.client.setex.call_args.args
+        assert key == "ss:session-1"
+        assert ttl == SESSION_TTL
+        assert decode_session(data).target_word == "happy"
+    
+    def test_get_round_trips_session(self):
+        """
+        Given: A serialized session stored in Redis
+        When: Reading it back
+        Then: Should return an equivalent session, or None when missing
+        """
+        self.store.client.get.return_value = encode_session(make_session())
+        assert self.store.get("session-1") == make_session()
+        
+        self.store.client.get.return_value = None
+        assert self.store.get("missing") is None
+
+
+class TestSessionSerialization:
+    """Test JSON session serialization."""
+    
+    def test_round_trip_keeps_server_state(self):
+        """
+        Given: A session mid-game with a misspelled found word and server-side synonyms
+        When: Serializing and deserializing it
+        Then: Should restore game state and actual synonyms, leaving derived lookups to be rebuilt
+        """
+        session = make_session()
+        session.synonyms[1].word = "joyfull"
+        session.synonyms[1].found = True
+        session.guess_count = 2
+        session.guessed_words = ["sad", "joyfull"]
+        session._actual_synonyms = ["glad", "joyful", "pleased", "cheerful"]
+        session._synonyms_lower = ("glad", "joyful", "pleased", "cheerful")
+        session._last_activity = 123.5
+        
+        restored = session_from_json(session_to_json(session))
+        
+        assert restored == session
+        assert restored.synonyms[1].word == "joyfull"
+        assert restored._actual_synonyms == session._actual_synonyms
+        assert restored._last_activity == 123.5
+        assert restored._synonyms_lower is None
+    
+    def test_large_sessions_compressed(self):
+        """
+        Given: A small session and one with a long guess history
+        When: Encoding them for storage
+        Then: Should store the small one raw and compress the large one, decoding both
+        """
+        small = make_session("small")
+        large = make_session("large")
+        large.guessed_words = [f"guess{'x' * (i % 10)}" for i in range(500)]
+        
+        small_data = encode_session(small)
+        large_data = encode_session(large)
+        
+        assert small_data[:1] == b"R"
+        assert large_data[:1] == b"Z"
+        assert len(session_to_json(large)) >= COMPRESSION_THRESHOLD
+        assert len(large_data) < len(session_to_json(large))
+        assert decode_session(small_data) == small
+        assert decode_session(large_data) == large
+        assert decode_session(session_to_json(small)) == small  # Untagged legacy payload
+
+
+class TestCreateSessionStore:
+    """Test session store selection."""
+    
+    def test_defaults_to_in_memory(self):
+        """
+        Given: No SESSION_BACKEND configured
+        When: Creating the session store
+        Then: Should use in-memory storage
+        """
+        with patch.dict('os.environ', {}, clear=True):
+            assert isinstance(create_session_store(), InMemorySessionStore)
+    
+    def test_sharded_backend(self):
+        """
+        Given: SESSION_BACKEND set to sharded
+        When: Creating the session store
+        Then: Should use the lock-striped in-memory store
+        """
+        with patch.dict('os.environ', {'SESSION_BACKEND': 'sharded'}):
+            assert isinstance(create_session_store(), ShardedSessionStore)
+    
+    def test_unknown_backend_rejected(self):
+        """
+        Given: An unsupported SESSION_BACKEND
+        When: Creating the session store
+        Then: Should raise ValueError
+        """
+        with patch.dict('os.environ', {'SESSION_BACKEND': 'carrier-pigeon'}):
+            with pytest.raises(ValueError):
+                create_session_store()
+    
+    def test_redis_backend_without_package_rejected(self):
+        """
+        Given: SESSION_BACKEND set to redis but the redis package not installed
+        When: Creating the session store
+        Then: Should raise a ValueError naming the missing package
+        """
+        with patch.dict('os.environ', {'SESSION_BACKEND': 'redis'}), \
+                patch.dict('sys.modules', {'redis': None}):
+            with pytest.raises(ValueError, match="requires the redis package"):
+                create_session_store()
+    
+    def test_agent_falls_back_to_in_memory(self):
+        """
+        Given: A configured backend that cannot be created
+        When: Initializing the Game Builder Agent
+        Then: Should fall back to in-memory sessions and still start games
+        """
+        with patch('src.game_builder_agent.create_session_store', side_effect=ConnectionError("down")):
+            agent = GameBuilderAgent()
+        
+        assert isinstance(agent.sessions, InMemorySessionStore)
+        response = agent.start_new_game()
+        assert response.session_id in agent.sessions
+    
+    def test_agent_skips_sweep_for_self_expiring_store(self):
+        """
+        Given: A session store that expires sessions itself
+        When: The periodic cleanup comes due
+        Then: Should not sweep or count the stored sessions
+        """
+        agent = GameBuilderAgent()
+        store = MagicMock(expires_natively=True)
+        agent.sessions = store
+        agent.last_cleanup = time.monotonic() - 2 * agent.session_cleanup_interval
+        
+        agent._cleanup_expired_sessions()
+        
+        store.sweep.assert_not_called()
+        store.__len__.assert_not_called()
+    
+    def test_agent_drains_expired_backlog_in_batches(self):
+        """
+        Given: More expired sessions than one sweep batch
+        When: The cleanup runs on consecutive requests
+        Then: Should evict one batch per call until the backlog is gone
+        """
+        agent = GameBuilderAgent()
+        agent.session_sweep_batch = 2
+        for session_id in ("a", "b", "c"):
+            session = make_session(session_id)
+            session._last_activity = time.time() - 2 * SESSION_TTL
+            agent.sessions.put(session_id, session)
+        agent.last_cleanup = time.monotonic() - 2 * agent.session_cleanup_interval
+        
+        agent._cleanup_expired_sessions()
+        assert list(agent.sessions) == ["c"]
+        
+        # Still due after a full batch
+        agent._cleanup_expired_sessions()
+        assert len(agent.sessions) == 0
+        
+        # Caught up, so the next sweep waits for the interval
+        agent.sessions.put("d", make_session("d"))
+        agent.sessions["d"]._last_activity = time.time() - 2 * SESSION_TTL
+        agent._cleanup_expired_sessions()
+        assert "d" in agent.sessions